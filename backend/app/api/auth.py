@@ -4,6 +4,7 @@ from app.models.actor import ActorProfile
 from app.models.billing import UsageMetrics
 from app.models.founding_actor import FoundingActor
 from app.models.user import User
+from app.services.email import outbox
 from app.services.email.marketing import verify_unsubscribe_token
 from app.services.email.notifications import (
     send_founder_offer_email,
@@ -120,18 +121,16 @@ def get_current_user(
                     db.refresh(user)
                 return user
             raise  # Unexpected — re-raise if we still can't find the user
-        # Send welcome email (fire-and-forget; don't block auth response)
-        try:
-            send_welcome_email(user_email=user.email, user_name=user.name)
-        except Exception:
-            pass  # Logged inside send_welcome_email
+        # Send welcome email (fire-and-forget; queued so Resend's round trip
+        # never blocks the auth response)
+        outbox.enqueue(send_welcome_email, user_email=user.email, user_name=user.name)
         # While founding spots are open, also send the FOUNDER3 offer as a
         # separate personal email. Admin-toggleable via the console.
         try:
             if app_settings.get_bool(
                 db, app_settings.FOUNDER_OFFER_ON_SIGNUP, default=True
             ):
-                send_founder_offer_email(user_email=user.email, user_name=user.name)
+                outbox.enqueue(send_founder_offer_email, user_email=user.email, user_name=user.name)
         except Exception as e:
             # Fire-and-forget; never block auth. Log so a misconfig (e.g. missing
             # app_settings table) isn't completely silent.
@@ -642,7 +642,7 @@ async def search_demo(
                 )
         _demo_search_last_request[client_ip] = now
 
-    search_q, _was_corrected, show_banner = correct_query_typos(q.strip())
+    search_q, _was_corrected, show_banner, _has_unrecognized = correct_query_typos(q.strip())
     corrected_for_demo: Optional[str] = search_q if show_banner else None
 
     search_service = SemanticSearch(db)
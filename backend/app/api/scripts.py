@@ -3,6 +3,7 @@ API endpoints for user script management - upload, edit, manage scripts
 """
 
 import asyncio
+import hashlib
 import json as _json
 from datetime import datetime
 from queue import Queue, Empty
@@ -208,14 +209,14 @@ async def scan_script(
     try:
         if file_ext == "pdf":
             pdf_file = io.BytesIO(file_content)
-            raw_text = ""
+            page_texts = []
             with _pdfplumber.open(pdf_file) as pdf:
                 actual_pdf_pages = len(pdf.pages)
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        raw_text += page_text + "\n\n"
-            raw_text = raw_text.strip()
+                        page_texts.append(page_text)
+            raw_text = "\n\n".join(page_texts).strip()
         else:
             try:
                 raw_text = file_content.decode("utf-8")
@@ -266,6 +267,46 @@ async def scan_script(
     )
 
 
+def _extraction_cache_key(file_hash: str, mode: str) -> str:
+    """
+    ExtractionCache key for a file's SHA256 and extraction mode.
+
+    Quick and full parses of the same file give different scene lists, so
+    a quick result must never answer a full-mode lookup.
+    """
+    return f"{mode}:{file_hash}"
+
+
+def _cached_extraction(db: Session, file_hash: str, mode: str) -> Optional[dict]:
+    """Look up a previous extraction of the same file content (SHA256) and mode."""
+    try:
+        cache_entry = db.query(ExtractionCache).filter(
+            ExtractionCache.file_hash == _extraction_cache_key(file_hash, mode)
+        ).first()
+        if cache_entry:
+            return cache_entry.extraction_result
+    except Exception:
+        pass  # Cache miss on error is fine
+    return None
+
+
+def _store_extraction(file_hash: str, mode: str, result: dict) -> None:
+    """Store an extraction result for future re-uploads (fresh session)."""
+    cache_db = SessionLocal()
+    try:
+        cache_db.add(ExtractionCache(
+            file_hash=_extraction_cache_key(file_hash, mode),
+            extraction_result=result,
+        ))
+        cache_db.commit()
+    except Exception:
+        # Non-critical — extraction still succeeds (e.g. a concurrent upload
+        # of the same file already stored it)
+        cache_db.rollback()
+    finally:
+        cache_db.close()
+
+
 # ============================================================================
 # Script Upload & Management
 # ============================================================================
@@ -309,14 +350,18 @@ async def upload_script(
 
     # ---- Phase 1: Extract everything BEFORE touching DB ----
     # This avoids DB connection timeouts during long AI extraction.
-    try:
-        parser = ScriptParser()
-        result = parser.parse_script(file_content, file_ext, file.filename)
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to extract script: {str(e)}"
-        )
+    file_hash = hashlib.sha256(file_content).hexdigest()
+    result = _cached_extraction(db, file_hash, "full")
+    if result is None:
+        try:
+            parser = ScriptParser()
+            result = parser.parse_script(file_content, file_ext, file.filename)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to extract script: {str(e)}"
+            )
+        _store_extraction(file_hash, "full", result)
 
     # ---- Phase 2: All DB writes happen quickly together ----
     # Close the stale session (idle during extraction) and get a fresh one.
@@ -514,7 +559,6 @@ async def upload_script_stream(
         raise HTTPException(status_code=400, detail="File too large (max 10MB)")
 
     # Compute file hash for extraction cache
-    import hashlib
     file_hash = hashlib.sha256(file_content).hexdigest()
 
     filename = file.filename
@@ -525,15 +569,7 @@ async def upload_script_stream(
     extraction_completed = [False]  # flag to suppress false-positive disconnect log after success
 
     # Check extraction cache before releasing DB
-    cached_result = None
-    try:
-        cache_entry = db.query(ExtractionCache).filter(
-            ExtractionCache.file_hash == file_hash
-        ).first()
-        if cache_entry:
-            cached_result = cache_entry.extraction_result
-    except Exception:
-        pass  # Cache miss on error is fine
+    cached_result = _cached_extraction(db, file_hash, extraction_mode)
 
     # Release the DB connection immediately — extraction takes minutes
     # and holding a connection during that time exhausts PgBouncer's pool.
@@ -628,16 +664,7 @@ async def upload_script_stream(
             result = extraction_result["data"]
 
             # Store in extraction cache for future re-uploads
-            try:
-                cache_db = SessionLocal()
-                cache_db.add(ExtractionCache(
-                    file_hash=file_hash,
-                    extraction_result=result,
-                ))
-                cache_db.commit()
-                cache_db.close()
-            except Exception:
-                pass  # Non-critical — extraction still succeeds
+            _store_extraction(file_hash, extraction_mode, result)
 
         # ---- Phase 2: DB writes (fresh connection with retry) ----
         # Abort if client disconnected during extraction
@@ -850,14 +877,18 @@ async def create_script_from_text(
         raise HTTPException(status_code=400, detail="Text too long (max 10MB)")
 
     # ---- Phase 1: Extract everything BEFORE touching DB ----
-    try:
-        parser = ScriptParser()
-        result = parser.parse_script(text_bytes, "txt", "Pasted script.txt")
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to extract script: {str(e)}"
-        )
+    text_hash = hashlib.sha256(text_bytes).hexdigest()
+    result = _cached_extraction(db, text_hash, "full")
+    if result is None:
+        try:
+            parser = ScriptParser()
+            result = parser.parse_script(text_bytes, "txt", "Pasted script.txt")
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to extract script: {str(e)}"
+            )
+        _store_extraction(text_hash, "full", result)
 
     # ---- Phase 2: All DB writes happen quickly together ----
     # Close the stale session (idle during extraction) and get a fresh one.
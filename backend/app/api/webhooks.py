@@ -10,7 +10,6 @@ All webhook handlers are idempotent to handle duplicate events.
 import json
 import logging
 import os
-import threading
 from datetime import datetime
 
 import stripe
@@ -183,18 +182,16 @@ def handle_checkout_completed(session: dict, db: Session):
                     print(f"✅ Auto-added {email_addr} to do-not-contact (paid subscriber)")
 
             # Send upgrade notification to admin (fire-and-forget)
+            from app.services.email import outbox
             from app.services.email.notifications import send_upgrade_notification
 
-            threading.Thread(
-                target=send_upgrade_notification,
-                kwargs={
-                    "user_name": user.name or "",
-                    "user_email": user.email,
-                    "tier_display_name": tier.display_name,
-                    "billing_period": billing_period,
-                },
-                daemon=True,
-            ).start()
+            outbox.enqueue(
+                send_upgrade_notification,
+                user_name=user.name or "",
+                user_email=user.email,
+                tier_display_name=tier.display_name,
+                billing_period=billing_period,
+            )
     except Exception as e:
         print(f"Warning: Could not process post-checkout tasks: {e}")
 
@@ -79,7 +79,7 @@ def _warmup_search_cache_background():
     def warmup():
         try:
             from app.services.search.cache_manager import cache_manager, COMMON_WARMUP_QUERIES
-            from app.services.ai.langchain.embeddings import generate_embedding
+            from app.services.ai.langchain.embeddings import generate_embeddings_batch
 
             if not cache_manager.redis_enabled:
                 logger.debug("Redis not available, skipping search cache warmup")
@@ -88,7 +88,7 @@ def _warmup_search_cache_background():
             logger.info("Starting search cache warmup (%d queries)...", len(COMMON_WARMUP_QUERIES))
             cache_manager.warmup_common_queries(
                 COMMON_WARMUP_QUERIES,
-                lambda q: generate_embedding(q, model="text-embedding-3-large", dimensions=1536)
+                lambda qs: generate_embeddings_batch(qs, model="text-embedding-3-large", dimensions=1536)
             )
             logger.info("Search cache warmup complete")
         except Exception as e:
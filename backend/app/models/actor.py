@@ -392,7 +392,7 @@ class ExtractionCache(Base):
     __tablename__ = "extraction_cache"
 
     id = Column(Integer, primary_key=True, index=True)
-    file_hash = Column(String, nullable=False, unique=True, index=True)  # SHA256 of file content
+    file_hash = Column(String, nullable=False, unique=True, index=True)  # "{mode}:{SHA256 of file content}"
     extraction_result = Column(JSON, nullable=False)  # Full extraction result (metadata + scenes)
     created_at = Column(DateTime(timezone=True), server_default=sql_text('now()'))
 
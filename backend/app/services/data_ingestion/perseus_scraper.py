@@ -9,12 +9,15 @@ API: Perseus Catalog API and XML-based text access.
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import xml.etree.ElementTree as ET
 
 import requests
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +35,11 @@ class PerseusScraper:
     TEXT_API = "https://www.perseus.tufts.edu/hopper/text"
     CTS_API = "https://cts.perseids.org/api/cts"
 
+    CTS_NS = "http://chs.harvard.edu/xmlns/cts"
+    XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
     RATE_LIMIT_DELAY = 1.5  # 1.5 seconds between requests
+    MAX_WORKERS = 4  # Concurrent author lookups (I/O bound, spacing still enforced)
 
     # Known classical dramatists
     CLASSICAL_DRAMATISTS = {
@@ -55,6 +62,20 @@ class PerseusScraper:
         self.session.headers.update({
             'User-Agent': 'ActorRise/1.0 (https://actorrise.com; classical drama research)'
         })
+        # Shared across worker threads so the 1.5s spacing holds globally
+        self._rate_lock = threading.Lock()
+        self._last_request_at = 0.0
+        # Full CTS catalog, loaded once on first author lookup
+        self._catalog_cache: Optional[Dict[str, List[Dict]]] = None
+        self._catalog_lock = threading.Lock()
+
+    def _throttle(self) -> None:
+        """Block until RATE_LIMIT_DELAY has passed since the previous request start."""
+        with self._rate_lock:
+            wait = self._last_request_at + self.RATE_LIMIT_DELAY - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_at = time.monotonic()
 
     def get_classical_plays(self, language: str = 'en') -> List[Dict]:
         """
@@ -70,12 +91,21 @@ class PerseusScraper:
 
         logger.info("Fetching classical Greek and Roman plays from Perseus...")
 
-        # Fetch plays for each known dramatist
-        for tradition in ['greek', 'roman']:
-            for author in self.CLASSICAL_DRAMATISTS[tradition]:
-                author_plays = self.search_by_author(author, language)
-                plays.extend(author_plays)
-                time.sleep(self.RATE_LIMIT_DELAY)
+        # Fetch plays for each known dramatist concurrently. Only the first
+        # lookup hits the network (catalog load); _throttle spaces requests.
+        authors = [
+            author
+            for tradition in ('greek', 'roman')
+            for author in self.CLASSICAL_DRAMATISTS[tradition]
+        ]
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.search_by_author, author, language)
+                for author in authors
+            ]
+            # Collect in submission order so output stays deterministic
+            for future in futures:
+                plays.extend(future.result())
 
         logger.info(f"Found {len(plays)} classical plays from Perseus")
         return plays
@@ -93,30 +123,99 @@ class PerseusScraper:
         """
         logger.info(f"Searching Perseus for plays by {author}...")
 
-        # Use CTS API to get catalog entries
-        params = {
-            'request': 'GetCapabilities',
-            'urn': f'urn:cts:greekLit:tlg*'  # Thesaurus Linguae Graecae URNs
-        }
+        lang = {'en': 'eng'}.get(language, language)
+        plays = [
+            self._format_catalog_work(author, work, work['translations'][lang], language)
+            for work in self._catalog().get(author, [])
+            if lang in work['translations']
+        ]
+        if plays:
+            return plays
 
-        plays = []
+        # Catalog unavailable or author missing: use the curated list
+        return self._get_known_works(author, language)
 
-        try:
-            # For now, use known works catalog
-            # In production, parse CTS GetCapabilities response
-            plays = self._get_known_works(author, language)
+    def _catalog(self) -> Dict[str, List[Dict]]:
+        """Return the CTS catalog keyed by author, fetching it on first use."""
+        if self._catalog_cache is None:
+            with self._catalog_lock:
+                if self._catalog_cache is None:
+                    self._catalog_cache = self._load_full_catalog()
+        return self._catalog_cache
+
+    def _load_full_catalog(self) -> Dict[str, List[Dict]]:
+        """
+        Fetch the whole CTS catalog with one unfiltered GetCapabilities call.
 
-        except requests.RequestException as e:
-            logger.error(f"Error searching Perseus for {author}: {e}")
+        The response is a few MB of XML, so it is streamed through
+        lxml.iterparse one <textgroup> at a time rather than parsed whole.
 
-        return plays
+        Returns:
+            Dict of author name -> list of works, each with 'title', 'urn'
+            and 'translations' (3-letter language code -> translation URN).
+            Empty if the request fails.
+        """
+        ns = {'cts': self.CTS_NS}
+        catalog: Dict[str, List[Dict]] = {}
+
+        try:
+            self._throttle()
+            response = self.session.get(
+                self.CTS_API,
+                params={'request': 'GetCapabilities'},
+                stream=True,
+                timeout=30,
+            )
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            for _, group in etree.iterparse(response.raw, tag=f'{{{self.CTS_NS}}}textgroup'):
+                author = group.findtext('cts:groupname', default='', namespaces=ns).strip()
+                works = []
+                for work in group.iterfind('cts:work', ns):
+                    translations = {
+                        t.get(self.XML_LANG): t.get('urn')
+                        for t in work.iterfind('cts:translation', ns)
+                        if t.get(self.XML_LANG) and t.get('urn')
+                    }
+                    works.append({
+                        'title': work.findtext('cts:title', default='', namespaces=ns).strip(),
+                        'urn': work.get('urn'),
+                        'translations': translations,
+                    })
+                if author:
+                    catalog.setdefault(author, []).extend(works)
+                group.clear()
+
+        except (requests.RequestException, etree.XMLSyntaxError) as e:
+            logger.error(f"Error loading Perseus CTS catalog: {e}")
+            return {}
+
+        logger.info(f"Loaded Perseus CTS catalog ({len(catalog)} authors)")
+        return catalog
+
+    def _format_catalog_work(self, author: str, work: Dict, urn: str, language: str) -> Dict:
+        """Shape a CTS catalog work like the curated play metadata dicts."""
+        return {
+            'title': work['title'],
+            'author': author,
+            'year': None,
+            'year_bce': False,
+            'url': f"{self.CTS_API}?request=GetPassage&urn={urn}",
+            'cts_urn': urn,
+            'source': 'perseus',
+            'copyright_status': 'public_domain',
+            'language': language,
+            'tradition': 'Greek' if author in self.CLASSICAL_DRAMATISTS['greek'] else 'Roman',
+            'genre': 'Tragedy' if author != 'Aristophanes' else 'Comedy'
+        }
 
     def _get_known_works(self, author: str, language: str) -> List[Dict]:
         """
         Get known works for classical authors.
 
-        This is a curated list of major works. In production, use CTS API
-        to dynamically fetch all available works.
+        Curated fallback for when the CTS catalog is unavailable or does not
+        list the author.
         """
         # Curated catalog of major classical plays
         known_works = {
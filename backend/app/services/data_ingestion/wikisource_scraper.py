@@ -9,13 +9,19 @@ API: MediaWiki API with respectful rate limiting.
 from __future__ import annotations
 
 import logging
+import re
 import time
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
-import requests
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Matches "| author = ..." / "| year = ..." fields of the {{header}} template
+_HEADER_FIELD_RE = re.compile(r'^\s*\|?\s*(author|year)\s*=\s*(.*?)\s*$', re.IGNORECASE)
+
 
 class WikisourceScraper:
     """
@@ -29,10 +35,15 @@ class WikisourceScraper:
     RATE_LIMIT_DELAY = 1.0  # 1 second between requests (respectful scraping)
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ActorRise/1.0 (https://actorrise.com; legal public domain scraper)'
-        })
+        # HTTP/2 multiplexes every API call over one TCP+TLS connection
+        self.client = httpx.Client(
+            http2=True,
+            headers={
+                'User-Agent': 'ActorRise/1.0 (https://actorrise.com; legal public domain scraper)'
+            },
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0),
+        )
 
     def search_plays(
         self,
@@ -68,9 +79,9 @@ class WikisourceScraper:
                 params['cmcontinue'] = continue_token
 
             try:
-                response = self.session.get(self.BASE_URL, params=params, timeout=10)
+                response = self.client.get(self.BASE_URL, params=params)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 members = data.get('query', {}).get('categorymembers', [])
 
@@ -96,7 +107,7 @@ class WikisourceScraper:
                 if not continue_token or len(plays) >= limit:
                     break
 
-            except requests.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(f"Error fetching Wikisource category '{category}': {e}")
                 break
 
@@ -113,30 +124,38 @@ class WikisourceScraper:
         Returns:
             Dict with play metadata or None if fetch fails
         """
+        # Only the lead section (rvsection=0) is needed: the {{header}} template
+        # with author/year lives there, and full plays can be megabytes of wikitext.
+        # Restricting templates to Template:Header lets us skip non-play pages early.
         params = {
             'action': 'query',
             'titles': title,
-            'prop': 'revisions|info',
+            'prop': 'revisions|info|templates',
             'rvprop': 'content',
             'rvslots': 'main',
+            'rvsection': 0,
+            'tltemplates': 'Template:Header',
             'format': 'json',
+            'formatversion': 2,
+            'utf8': 1,
             'inprop': 'url'
         }
 
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response = self.client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
-
-            pages = data.get('query', {}).get('pages', {})
+            data = orjson.loads(response.content)
 
-            # Get first (and only) page
-            page_id = list(pages.keys())[0]
-            if page_id == '-1':
+            # formatversion=2 returns pages as a list instead of a dict keyed by ID
+            pages = data.get('query', {}).get('pages') or []
+            if not pages or pages[0].get('missing'):
                 logger.warning(f"Page not found: {title}")
                 return None
 
-            page = pages[page_id]
+            page = pages[0]
+            if not page.get('templates'):
+                logger.debug(f"Skipping '{title}': no header template")
+                return None
 
             # Extract metadata
             page_title = page.get('title', '')
@@ -144,8 +163,9 @@ class WikisourceScraper:
 
             # Try to extract author and year from title or content
             # Format is often "Title (Author)" or "Title/Author"
-            author = self._extract_author(page_title, page.get('revisions', [{}])[0])
-            year = self._extract_year(page.get('revisions', [{}])[0])
+            author, year = self._extract_header_fields(
+                page_title, page.get('revisions', [{}])[0]
+            )
 
             return {
                 'title': page_title,
@@ -157,7 +177,7 @@ class WikisourceScraper:
                 'language': 'en'
             }
 
-        except (requests.RequestException, KeyError, IndexError) as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError, KeyError, IndexError) as e:
             logger.error(f"Error fetching details for '{title}': {e}")
             return None
 
@@ -177,41 +197,77 @@ class WikisourceScraper:
             'prop': 'revisions',
             'rvprop': 'content',
             'rvslots': 'main',
-            'format': 'json'
+            'format': 'json',
+            'formatversion': 2,
+            'utf8': 1
         }
 
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response = self.client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            pages = data.get('query', {}).get('pages', {})
-            page_id = list(pages.keys())[0]
-
-            if page_id == '-1':
+            # Single-title query: formatversion=2 gives a one-element pages list
+            pages = data.get('query', {}).get('pages') or []
+            if not pages or pages[0].get('missing'):
                 logger.warning(f"Page not found: {title}")
                 return None
 
-            page = pages[page_id]
-            revisions = page.get('revisions', [])
+            revisions = pages[0].get('revisions', [])
 
             if not revisions:
                 return None
 
-            content = revisions[0].get('slots', {}).get('main', {}).get('*', '')
+            content = self._revision_content(revisions[0])
 
             # Clean up wiki markup (basic cleanup - more sophisticated parsing may be needed)
             text = self._clean_wikitext(content)
 
             return text
 
-        except (requests.RequestException, KeyError, IndexError) as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError, KeyError, IndexError) as e:
             logger.error(f"Error fetching text for '{title}': {e}")
             return None
 
-    def _extract_author(self, title: str, revision: Dict) -> Optional[str]:
-        """Extract author from title or content."""
-        # Common patterns: "Title (Author)", "Author/Title", etc.
+    @staticmethod
+    def _revision_content(revision: Dict) -> str:
+        """Return main-slot wikitext for both formatversion=1 ('*') and 2 ('content')."""
+        main = revision.get('slots', {}).get('main', {})
+        return main.get('content', main.get('*', ''))
+
+    def _extract_header_fields(
+        self, title: str, revision: Dict
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """Extract author and publication year in one pass over the header lines."""
+        author = self._author_from_title(title)
+        year = None
+
+        content = self._revision_content(revision)
+        has_header = '{{header' in content.lower()
+
+        # islice over splitlines' iterator stops after 30 lines, and the early
+        # break skips the rest once both fields are found.
+        for line in islice(iter(content.splitlines()), 30):
+            match = _HEADER_FIELD_RE.match(line)
+            if not match:
+                continue
+            field, value = match.group(1).lower(), match.group(2).strip('|').strip()
+            if field == 'author':
+                if author is None and has_header and value and not value.startswith('{'):
+                    author = value
+            elif year is None:
+                try:
+                    year = int(value)
+                except ValueError:
+                    pass
+            if author is not None and year is not None:
+                break
+
+        return author, year
+
+    @staticmethod
+    def _author_from_title(title: str) -> Optional[str]:
+        """Extract author from titles shaped like "Title (Author)"."""
         if '(' in title and ')' in title:
             # Extract text in parentheses
             start = title.rfind('(')
@@ -220,32 +276,6 @@ class WikisourceScraper:
                 author = title[start + 1:end].strip()
                 if author and not author.isdigit():  # Not just a year
                     return author
-
-        # Try to extract from wikitext headers
-        content = revision.get('slots', {}).get('main', {}).get('*', '')
-        if '{{header' in content.lower():
-            # Look for author field in header template
-            for line in content.split('\n')[:20]:  # Check first 20 lines
-                if 'author' in line.lower() and '=' in line:
-                    author = line.split('=', 1)[1].strip().strip('|').strip()
-                    if author and not author.startswith('{'):
-                        return author
-
-        return None
-
-    def _extract_year(self, revision: Dict) -> Optional[int]:
-        """Extract publication year from content."""
-        content = revision.get('slots', {}).get('main', {}).get('*', '')
-
-        # Look for year in header template
-        for line in content.split('\n')[:30]:  # Check first 30 lines
-            if 'year' in line.lower() and '=' in line:
-                year_str = line.split('=', 1)[1].strip().strip('|').strip()
-                try:
-                    return int(year_str)
-                except ValueError:
-                    continue
-
         return None
 
     def _clean_wikitext(self, text: str) -> str:
@@ -255,9 +285,6 @@ class WikisourceScraper:
         Removes common MediaWiki markup to get cleaner text.
         For production use, consider using a proper wikitext parser like mwparserfromhell.
         """
-        # Remove templates (basic - {{template}})
-        import re
-
         # Remove header templates
         text = re.sub(r'\{\{header[^\}]*\}\}', '', text, flags=re.IGNORECASE | re.DOTALL)
 
@@ -307,9 +334,9 @@ class WikisourceScraper:
         }
 
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response = self.client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             members = data.get('query', {}).get('categorymembers', [])
             subcategories = [m['title'].replace('Category:', '') for m in members]
@@ -317,6 +344,6 @@ class WikisourceScraper:
             logger.info(f"Found {len(subcategories)} subcategories under '{category}'")
             return subcategories
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"Error fetching subcategories for '{category}': {e}")
             return []
@@ -5,6 +5,7 @@ Handles targeted campaign sending with opt-in verification
 and unsubscribe token management.
 """
 
+import asyncio
 import hashlib
 import hmac
 import os
@@ -208,6 +209,10 @@ def send_campaign(
     if not render_fn:
         return {"sent": 0, "skipped": 0, "errors": [f"Unsupported campaign type: {campaign_type}"], "recipients": []}
 
+    # Render everything first, then send the whole campaign as one pooled
+    # burst instead of a fresh HTTPS request per recipient
+    messages: list[dict] = []
+    addressees: list[User] = []
     for user in recipients:
         try:
             unsub_url = build_unsubscribe_url(user.email)
@@ -216,16 +221,25 @@ def send_campaign(
                 unsubscribe_url=unsub_url,
                 **template_kwargs,
             )
-            client.send_email(
-                to=user.email,
-                subject=subject,
-                html=html,
-                unsubscribe_url=unsub_url,
-            )
-            result["sent"] += 1
         except Exception as e:
             result["errors"].append(f"{user.email}: {e}")
             result["skipped"] += 1
+            continue
+        messages.append({
+            "to": user.email,
+            "subject": subject,
+            "html": html,
+            "unsubscribe_url": unsub_url,
+        })
+        addressees.append(user)
+
+    responses = asyncio.run(client.send_many(messages)) if messages else []
+    for user, response in zip(addressees, responses):
+        if isinstance(response, Exception):
+            result["errors"].append(f"{user.email}: {response}")
+            result["skipped"] += 1
+        else:
+            result["sent"] += 1
 
     return result
 
@@ -6,12 +6,81 @@ submission workflow and welcome emails.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from app.services.email.resend_client import ResendEmailClient
 from app.services.email.templates import EmailTemplates
 
 
+# Read once at import; the key does not change while the process runs.
+# Call refresh_config() after changing the environment (e.g. in tests).
+_RESEND_ENABLED = bool(os.getenv("RESEND_API_KEY"))
+
+
+def refresh_config() -> None:
+    """Re-read RESEND_API_KEY from the environment."""
+    global _RESEND_ENABLED
+    _RESEND_ENABLED = bool(os.getenv("RESEND_API_KEY"))
+
+
+_SUBMISSION_SUBJECTS = {
+    'received': "Submission Received: {title}",
+    'approved': "🎉 Submission Approved: {title}",
+    'rejected': "Submission Update: {title}",
+    'under_review': "Submission Under Review: {title}",
+}
+
+
+def _submission_subject(status: str, monologue_title: str) -> str:
+    """Subject line for a submission notification; raises on unknown status."""
+    if status not in _SUBMISSION_SUBJECTS:
+        raise ValueError(f"Invalid status: {status}. Must be one of: received, approved, rejected, under_review")
+    return _SUBMISSION_SUBJECTS[status].format(title=monologue_title)
+
+
+@lru_cache(maxsize=512)
+def _render_submission_html(
+    status: str,
+    user_name: str,
+    monologue_title: str,
+    monologue_url: Optional[str],
+    rejection_reason: Optional[str],
+    rejection_details: Optional[str],
+    estimated_review_time: str,
+) -> str:
+    """
+    Render the submission email body for a status.
+
+    Memoized on the full argument tuple: bulk admin approvals/rejections
+    re-send identical emails, so repeat renders skip Jinja entirely.
+    """
+    templates = EmailTemplates()
+    if status == 'received':
+        return templates.render_submission_received(
+            user_name=user_name,
+            monologue_title=monologue_title
+        )
+    if status == 'approved':
+        return templates.render_submission_approved(
+            user_name=user_name,
+            monologue_title=monologue_title,
+            monologue_url=monologue_url
+        )
+    if status == 'rejected':
+        return templates.render_submission_rejected(
+            user_name=user_name,
+            monologue_title=monologue_title,
+            reason=rejection_reason or "Unknown",
+            details=rejection_details or "No details provided."
+        )
+    return templates.render_submission_under_review(
+        user_name=user_name,
+        monologue_title=monologue_title,
+        estimated_review_time=estimated_review_time
+    )
+
+
 def send_welcome_email(user_email: str, user_name: Optional[str] = None) -> dict:
     """
     Send welcome email to new signups.
@@ -23,7 +92,7 @@ def send_welcome_email(user_email: str, user_name: Optional[str] = None) -> dict
     Returns:
         Resend response dict, or mock if RESEND_API_KEY not set
     """
-    if not os.getenv("RESEND_API_KEY"):
+    if not _RESEND_ENABLED:
         print("Warning: RESEND_API_KEY not set. Welcome email disabled.")
         return {"id": "mock_welcome_id", "status": "disabled"}
 
@@ -46,7 +115,7 @@ def send_founder_offer_email(user_email: str, user_name: Optional[str] = None) -
 
     Gated upstream by the `founder_offer_on_signup` admin toggle.
     """
-    if not os.getenv("RESEND_API_KEY"):
+    if not _RESEND_ENABLED:
         print("Warning: RESEND_API_KEY not set. Founder offer email disabled.")
         return {"id": "mock_founder_offer_id", "status": "disabled"}
 
@@ -97,51 +166,24 @@ def send_submission_notification(
         Exception: If email sending fails
     """
     # Check if Resend is configured
-    if not os.getenv("RESEND_API_KEY"):
+    if not _RESEND_ENABLED:
         print("Warning: RESEND_API_KEY not set. Email notifications are disabled.")
         return {'id': 'mock_email_id', 'status': 'disabled'}
 
     try:
         client = ResendEmailClient()
-        templates = EmailTemplates()
-
-        # Render template based on status
-        if status == 'received':
-            subject = f"Submission Received: {monologue_title}"
-            html = templates.render_submission_received(
-                user_name=user_name,
-                monologue_title=monologue_title
-            )
-
-        elif status == 'approved':
-            subject = f"🎉 Submission Approved: {monologue_title}"
-            if not monologue_url:
-                monologue_url = "https://actorrise.com/monologues"
-            html = templates.render_submission_approved(
-                user_name=user_name,
-                monologue_title=monologue_title,
-                monologue_url=monologue_url
-            )
-
-        elif status == 'rejected':
-            subject = f"Submission Update: {monologue_title}"
-            html = templates.render_submission_rejected(
-                user_name=user_name,
-                monologue_title=monologue_title,
-                reason=rejection_reason or "Unknown",
-                details=rejection_details or "No details provided."
-            )
-
-        elif status == 'under_review':
-            subject = f"Submission Under Review: {monologue_title}"
-            html = templates.render_submission_under_review(
-                user_name=user_name,
-                monologue_title=monologue_title,
-                estimated_review_time=estimated_review_time
-            )
-
-        else:
-            raise ValueError(f"Invalid status: {status}. Must be one of: received, approved, rejected, under_review")
+        subject = _submission_subject(status, monologue_title)
+        if status == 'approved' and not monologue_url:
+            monologue_url = "https://actorrise.com/monologues"
+        html = _render_submission_html(
+            status,
+            user_name,
+            monologue_title,
+            monologue_url,
+            rejection_reason,
+            rejection_details,
+            estimated_review_time,
+        )
 
         # Send email
         response = client.send_email(
@@ -165,9 +207,9 @@ def send_upgrade_notification(
 ) -> dict:
     """
     Send upgrade notification to admin when a user upgrades to a paid tier.
-    Fire-and-forget — never raises.
+    Queued through the email outbox; raises on failure so the job is retried.
     """
-    if not os.getenv("RESEND_API_KEY"):
+    if not _RESEND_ENABLED:
         print("Warning: RESEND_API_KEY not set. Upgrade notification disabled.")
         return {"id": "mock_upgrade_id", "status": "disabled"}
 
@@ -192,4 +234,4 @@ def send_upgrade_notification(
         )
     except Exception as e:
         print(f"Error sending upgrade notification: {e}")
-        return {"id": "error", "status": "failed"}
+        raise
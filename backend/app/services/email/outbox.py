@@ -0,0 +1,97 @@
+"""
+In-process background queue for outbound email.
+
+Request handlers enqueue a send and return immediately instead of paying
+Resend's network round trip on the request thread. A small pool of daemon
+workers drains the queue; failed sends are retried with exponential backoff
+and, once retries run out, recorded in a bounded dead-letter list so the
+admin console / logs can surface them.
+"""
+
+import logging
+import queue
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKER_COUNT = 2
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 2.0  # 2s, 4s, 8s, 16s, 32s
+
+
+class _EmailJob(NamedTuple):
+    send_fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    attempt: int
+
+
+_jobs: "queue.Queue[_EmailJob]" = queue.Queue()
+_start_lock = threading.Lock()
+_workers_started = False
+
+# Jobs that exhausted their retries (most recent last)
+dead_letters: Deque[Dict[str, Any]] = deque(maxlen=100)
+
+
+def enqueue(send_fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """
+    Queue send_fn(*args, **kwargs) to run on a background email worker.
+
+    send_fn should raise on failure so the job is retried; the helpers in
+    notifications.py do. A returned {"status": "failed"} dict is treated
+    the same way, so a helper that swallows its error is still retried.
+    """
+    _ensure_workers()
+    _jobs.put(_EmailJob(send_fn, args, kwargs, 0))
+
+
+def _ensure_workers() -> None:
+    global _workers_started
+    if _workers_started:
+        return
+    with _start_lock:
+        if _workers_started:
+            return
+        for i in range(WORKER_COUNT):
+            threading.Thread(target=_worker, name=f"email-outbox-{i}", daemon=True).start()
+        _workers_started = True
+
+
+def _worker() -> None:
+    while True:
+        job = _jobs.get()
+        try:
+            _run(job)
+        finally:
+            _jobs.task_done()
+
+
+def _run(job: _EmailJob) -> None:
+    name = getattr(job.send_fn, "__name__", repr(job.send_fn))
+    try:
+        result = job.send_fn(*job.args, **job.kwargs)
+        if isinstance(result, dict) and result.get("status") == "failed":
+            raise RuntimeError(f"{name} returned status 'failed'")
+    except Exception as e:
+        if job.attempt < MAX_RETRIES:
+            delay = BACKOFF_BASE_SECONDS * (2 ** job.attempt)
+            logger.warning(
+                "Email job %s failed (attempt %d/%d), retrying in %.0fs: %s",
+                name, job.attempt + 1, MAX_RETRIES + 1, delay, e,
+            )
+            # Re-queue after the delay without tying up a worker thread
+            timer = threading.Timer(delay, _jobs.put, args=(job._replace(attempt=job.attempt + 1),))
+            timer.daemon = True
+            timer.start()
+        else:
+            logger.error("Email job %s failed permanently: %s", name, e)
+            dead_letters.append({
+                "job": name,
+                "kwargs": job.kwargs,
+                "error": str(e),
+                "failed_at": datetime.now(timezone.utc).isoformat(),
+            })
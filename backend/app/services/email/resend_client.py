@@ -7,10 +7,16 @@ Handles:
 - Manual review notifications
 """
 
+import asyncio
 import os
-from typing import Optional
+from typing import List, Optional, Union
 
-import resend
+import httpx
+
+RESEND_API_URL = "https://api.resend.com"
+
+# Attempts per message in send_many when Resend answers 429 (rate limited)
+RATE_LIMIT_ATTEMPTS = 3
 
 
 class ResendEmailClient:
@@ -34,8 +40,6 @@ class ResendEmailClient:
                 "RESEND_API_KEY not found. Please set it in your environment or pass it to the constructor."
             )
 
-        resend.api_key = self.api_key
-
     def send_email(
         self,
         to: str,
@@ -66,19 +70,18 @@ class ResendEmailClient:
             Exception: If email sending fails
         """
         try:
-            params: dict = {
-                "from": from_email,
-                "to": to,
-                "subject": subject,
-                "reply_to": "canberk@actorrise.com",
-            }
-            if plain_text:
-                params["text"] = plain_text
-            else:
-                params["html"] = html
-            if scheduled_at:
-                params["scheduled_at"] = scheduled_at
+            params = self._build_params(
+                to=to,
+                subject=subject,
+                html=html,
+                from_email=from_email,
+                scheduled_at=scheduled_at,
+                plain_text=plain_text,
+            )
 
+            # The resend SDK takes ~250ms to import; load it on first send
+            import resend
+            resend.api_key = self.api_key
             response = resend.Emails.send(params)
 
             return response
@@ -86,3 +89,75 @@ class ResendEmailClient:
         except Exception as e:
             print(f"Error sending email to {to}: {e}")
             raise
+
+    async def send_many(
+        self,
+        messages: List[dict],
+        concurrency: int = 10,
+    ) -> List[Union[dict, Exception]]:
+        """
+        Send a burst of emails concurrently over one pooled HTTP/2 connection.
+
+        Each message takes the same keyword arguments as send_email. The TLS
+        handshake is paid once for the whole burst, and up to `concurrency`
+        requests are in flight at a time. A 429 is retried after the
+        Retry-After delay, up to RATE_LIMIT_ATTEMPTS attempts.
+
+        The client lives for the duration of the call: an httpx.AsyncClient is
+        bound to the event loop it first runs on, and callers typically drive
+        this with asyncio.run() from worker threads.
+
+        Returns:
+            One entry per message, in order: the Resend response dict, or the
+            exception raised for that message.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            http2=True,
+            base_url=RESEND_API_URL,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0),
+        ) as client:
+
+            async def _send_one(message: dict) -> dict:
+                params = self._build_params(**message)
+                async with semaphore:
+                    for attempt in range(RATE_LIMIT_ATTEMPTS):
+                        response = await client.post("/emails", json=params)
+                        if response.status_code != 429 or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                            break
+                        await asyncio.sleep(float(response.headers.get("retry-after", 1)))
+                    response.raise_for_status()
+                    return response.json()
+
+            return await asyncio.gather(
+                *(_send_one(m) for m in messages),
+                return_exceptions=True,
+            )
+
+    @staticmethod
+    def _build_params(
+        to: str,
+        subject: str,
+        html: str = "",
+        from_email: str = "Canberk <canberk@actorrise.com>",
+        scheduled_at: Optional[str] = None,
+        unsubscribe_url: Optional[str] = None,
+        plain_text: Optional[str] = None,
+    ) -> dict:
+        """Build the Resend send payload shared by send_email and send_many."""
+        params: dict = {
+            "from": from_email,
+            "to": to,
+            "subject": subject,
+            "reply_to": "canberk@actorrise.com",
+        }
+        if plain_text:
+            params["text"] = plain_text
+        else:
+            params["html"] = html
+        if scheduled_at:
+            params["scheduled_at"] = scheduled_at
+        return params
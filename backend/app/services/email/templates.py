@@ -13,6 +13,31 @@ from typing import Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+# Templates rendered directly (base*.html are only extended)
+_TEMPLATE_NAMES = (
+    'submission_received.html',
+    'submission_approved.html',
+    'submission_rejected.html',
+    'submission_under_review.html',
+    'welcome.html',
+    'upgrade_notification.html',
+    'founder_offer.html',
+    'weekly_engagement.html',
+    'custom.html',
+)
+
+# One Environment per process so Jinja's compiled-template cache is shared by
+# every EmailTemplates instance. auto_reload=False skips the mtime stat on
+# each get_template; templates only change on deploy.
+_env = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    autoescape=select_autoescape(['html', 'xml']),
+    auto_reload=False,
+    cache_size=400,
+)
+# Load every template up front so renders skip the loader lookup
+_templates = {name: _env.get_template(name) for name in _TEMPLATE_NAMES}
+
 
 class EmailTemplates:
     """
@@ -22,12 +47,9 @@ class EmailTemplates:
     """
 
     def __init__(self):
-        """Initialize Jinja2 environment."""
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        """Attach the shared Jinja2 environment and preloaded templates."""
+        self.env = _env
+        self._templates = _templates
 
     def render_submission_received(
         self,
@@ -44,7 +66,7 @@ class EmailTemplates:
         Returns:
             HTML email content
         """
-        template = self.env.get_template('submission_received.html')
+        template = self._templates['submission_received.html']
         return template.render(
             user_name=user_name,
             monologue_title=monologue_title
@@ -67,7 +89,7 @@ class EmailTemplates:
         Returns:
             HTML email content
         """
-        template = self.env.get_template('submission_approved.html')
+        template = self._templates['submission_approved.html']
         return template.render(
             user_name=user_name,
             monologue_title=monologue_title,
@@ -93,7 +115,7 @@ class EmailTemplates:
         Returns:
             HTML email content
         """
-        template = self.env.get_template('submission_rejected.html')
+        template = self._templates['submission_rejected.html']
         return template.render(
             user_name=user_name,
             monologue_title=monologue_title,
@@ -118,7 +140,7 @@ class EmailTemplates:
         Returns:
             HTML email content
         """
-        template = self.env.get_template('submission_under_review.html')
+        template = self._templates['submission_under_review.html']
         return template.render(
             user_name=user_name,
             monologue_title=monologue_title,
@@ -131,7 +153,7 @@ class EmailTemplates:
         unsubscribe_url: Optional[str] = None,
     ) -> str:
         """Render welcome email for new signups."""
-        template = self.env.get_template('welcome.html')
+        template = self._templates['welcome.html']
         return template.render(
             user_name=user_name or "there",
             unsubscribe_url=unsubscribe_url,
@@ -146,7 +168,7 @@ class EmailTemplates:
         timestamp: str,
     ) -> str:
         """Render upgrade notification email (sent to admin)."""
-        template = self.env.get_template('upgrade_notification.html')
+        template = self._templates['upgrade_notification.html']
         return template.render(
             user_name=user_name,
             user_email=user_email,
@@ -170,7 +192,7 @@ class EmailTemplates:
         **kwargs,
     ) -> str:
         """Render founder offer email with promo code, testimony ask, and share CTA."""
-        template = self.env.get_template('founder_offer.html')
+        template = self._templates['founder_offer.html']
         return template.render(
             user_name=user_name or "there",
             intro_text=intro_text,
@@ -194,7 +216,7 @@ class EmailTemplates:
         **kwargs,  # Ignore old params for backwards compatibility
     ) -> str:
         """Render weekly engagement digest email."""
-        template = self.env.get_template('weekly_engagement.html')
+        template = self._templates['weekly_engagement.html']
         return template.render(
             user_name=user_name or "there",
             character_analysis=character_analysis,
@@ -382,7 +404,7 @@ class EmailTemplates:
         **kwargs,
     ) -> str:
         """Render custom freeform email with Markdown support (HTML version for preview)."""
-        template = self.env.get_template('custom.html')
+        template = self._templates['custom.html']
         body_html = self._markdown_to_html(body_markdown) if body_markdown else ""
         return template.render(
             user_name=user_name or "there",
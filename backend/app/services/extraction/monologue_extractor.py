@@ -14,6 +14,14 @@ class MonologueExtractor:
         self.plain_text_parser = PlainTextParser()
         self.pdf_parser = PDFParser()
 
+        # format_type -> extractor(content, min_words, max_words)
+        self._dispatch = {
+            'tei_xml': self.tei_parser.extract_monologues,
+            'plain_text': self.plain_text_parser.extract_monologues,
+            'pdf': self.pdf_parser.extract_monologues,
+            'html': self._extract_html,
+        }
+
     def extract_from_source(
         self,
         content: str,
@@ -37,26 +45,22 @@ class MonologueExtractor:
                 - word_count: int
                 - stage_directions: str | None
         """
-        if format_type == 'tei_xml':
-            return self.tei_parser.extract_monologues(content, min_words, max_words)
-
-        elif format_type == 'plain_text':
-            return self.plain_text_parser.extract_monologues(content, min_words, max_words)
-
-        elif format_type == 'pdf':
-            return self.pdf_parser.extract_monologues(content, min_words, max_words)
+        try:
+            extract = self._dispatch[format_type]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format_type}") from None
+        return extract(content, min_words, max_words)
 
-        elif format_type == 'html':
-            # Convert HTML to plain text first
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
+    def _extract_html(self, content: str, min_words: int, max_words: int) -> List[Dict]:
+        """Convert HTML to plain text, then extract as plain text."""
+        # Imported on first HTML source rather than with the extraction package
+        from selectolax.lexbor import LexborHTMLParser
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+        tree = LexborHTMLParser(content)
 
-            plain_text = soup.get_text()
-            return self.plain_text_parser.extract_monologues(plain_text, min_words, max_words)
+        # Remove script and style elements
+        for node in tree.css('script, style'):
+            node.decompose()
 
-        else:
-            raise ValueError(f"Unsupported format: {format_type}")
+        plain_text = tree.text()
+        return self.plain_text_parser.extract_monologues(plain_text, min_words, max_words)
@@ -1,7 +1,17 @@
 """Extract monologues from plain text plays using pattern matching."""
 
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# One anchored rule covers both header styles, classified line by line:
+#   "HAMLET:\n  To be or not to be..."   (name alone, colon, speech below)
+#   "HAMLET. To be or not to be..."      (name, period, speech on same line)
+_SPEAKER_LINE = re.compile(r'^([A-Z][A-Z\s\-\.]{1,40})[:.]\s*(.*)$')
+
+# Stage directions (usually in parentheses or brackets); one pattern both
+# strips them from the speech and collects their contents
+_PAT_STAGE = re.compile(r'\(([^)]+)\)|\[([^\]]+)\]')
 
 
 class PlainTextParser:
@@ -28,40 +38,31 @@ class PlainTextParser:
 
         CHARACTER. Line of dialogue...
         """
-        monologues = []
-
-        # Pattern 1: Character name followed by colon (most common)
-        # Matches: "HAMLET:\n  To be or not to be..."
-        pattern1 = r'([A-Z][A-Z\s\-\.]+):\s*\n((?:(?!\n[A-Z][A-Z\s\-\.]+:)(?!\n\n[A-Z][A-Z\s\-\.]+\.).)+'
-        pattern1 += r'(?:\n(?![ \t]*\n)(?![A-Z][A-Z\s\-\.]+:).)*)'
-
-        # Pattern 2: Character name in all caps at start of line followed by period
-        # Matches: "HAMLET. To be or not to be..."
-        pattern2 = r'\n([A-Z][A-Z\s\-\.]+)\.\s+([^\n]+(?:\n(?![A-Z][A-Z\s\-\.]+[\.:])[^\n]+)*)'
+        return self.extract_monologues_from_lines(text.splitlines(), min_words, max_words)
 
-        speeches = []
+    def extract_monologues_from_lines(
+        self,
+        lines: Iterable[str],
+        min_words: int = 50,
+        max_words: int = 500
+    ) -> List[Dict]:
+        """
+        Extract monologues from an iterable of lines (no trailing newlines).
 
-        # Try pattern 1 (colon format)
-        for match in re.finditer(pattern1, text, re.MULTILINE):
-            character = match.group(1).strip()
-            speech_text = match.group(2).strip()
-            speeches.append((character, speech_text))
+        Lines are consumed lazily, so callers can stream a large source
+        (e.g. a PDF page by page) without building the whole text first.
+        """
+        monologues = []
 
-        # If pattern 1 didn't find much, try pattern 2
-        if len(speeches) < 5:
-            speeches = []
-            for match in re.finditer(pattern2, text, re.MULTILINE):
-                character = match.group(1).strip()
-                speech_text = match.group(2).strip()
-                speeches.append((character, speech_text))
+        speeches = self._split_speech_lines(lines)
 
         # Filter and clean speeches
         for character, speech_text in speeches:
             # Remove stage directions (usually in parentheses or brackets)
-            clean_text = re.sub(r'\([^)]+\)|\[[^\]]+\]', '', speech_text)
+            clean_text = _PAT_STAGE.sub('', speech_text)
 
             # Remove extra whitespace
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+            clean_text = ' '.join(clean_text.split())
 
             # Skip if too short or starts with common non-dialogue indicators
             if not clean_text or clean_text.lower().startswith(('scene', 'act', 'enter', 'exit')):
@@ -79,7 +80,45 @@ class PlainTextParser:
 
         return monologues
 
-    def _normalize_character_name(self, name: str) -> str:
+    def _split_speeches(self, text: str) -> List[Tuple[str, str]]:
+        """Split text into (character, speech) pairs; see _split_speech_lines."""
+        return self._split_speech_lines(text.splitlines())
+
+    def _split_speech_lines(self, lines: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Split lines into (character, speech) pairs in a single pass.
+
+        A speaker line starts a new speech, non-blank lines extend the current
+        one, and a blank line ends it. O(n) in characters, no backtracking.
+        """
+        speeches: List[Tuple[str, str]] = []
+        character: Optional[str] = None
+        buf: List[str] = []
+
+        def flush() -> None:
+            if character and buf:
+                speeches.append((character, '\n'.join(buf).strip()))
+
+        for line in lines:
+            match = _SPEAKER_LINE.match(line)
+            if match:
+                flush()
+                character, first = match.group(1).strip(), match.group(2)
+                buf = [first] if first else []
+            elif line.strip() and character:
+                buf.append(line)
+            elif buf:
+                # Blank line ends the speech (blank lines right after a bare
+                # "NAME:" header are skipped until the speech starts)
+                flush()
+                character, buf = None, []
+
+        flush()
+        return speeches
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_character_name(name: str) -> str:
         """Convert 'HAMLET' to 'Hamlet', handle edge cases"""
         # Remove periods and extra spaces
         name = name.replace('.', '').strip()
@@ -96,16 +135,8 @@ class PlainTextParser:
         return name
 
     def _extract_stage_directions(self, text: str) -> Optional[str]:
-        """Extract stage directions from text"""
-        directions = []
-
-        # Find text in parentheses
-        paren_matches = re.findall(r'\(([^)]+)\)', text)
-        directions.extend(paren_matches)
-
-        # Find text in brackets
-        bracket_matches = re.findall(r'\[([^\]]+)\]', text)
-        directions.extend(bracket_matches)
+        """Extract stage directions from text, in the order they appear"""
+        directions = [paren or bracket for paren, bracket in _PAT_STAGE.findall(text)]
 
         if directions:
             return ' '.join(directions)
@@ -1,110 +1,378 @@
-"""Parse TEI-encoded plays (XML format used by scholarly editions)."""
+"""
+Parse TEI-encoded plays (used by Perseus Digital Library and other scholarly sources).
+
+TEI (Text Encoding Initiative) is a standard XML format for encoding texts in digital humanities.
+Perseus uses TEI XML for their classical texts with speaker tags, line numbers, and stage directions.
+"""
+
+from __future__ import annotations
 
-from lxml import etree
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
+
+_NS = {'tei': 'http://www.tei-c.org/ns/1.0'}
+
+# <sp> elements streamed by iterparse, with or without the TEI namespace
+_SP_TAGS = ('{http://www.tei-c.org/ns/1.0}sp', 'sp')
+
+# XPath expressions compiled once; each matches both namespaced and bare TEI
+_SP_XP = etree.XPath('//tei:sp | //sp', namespaces=_NS)
+_SPEAKER_XP = etree.XPath('./tei:speaker | ./speaker', namespaces=_NS)
+_LINES_XP = etree.XPath('.//tei:l | .//l', namespaces=_NS)
+_PARAS_XP = etree.XPath('.//tei:p | .//p | .//tei:ab | .//ab', namespaces=_NS)
+_HEADER_XP = etree.XPath('(//tei:teiHeader | //teiHeader)[1]', namespaces=_NS)
+_TITLE_XP = etree.XPath('(.//tei:title | .//title)[1]', namespaces=_NS)
+_AUTHOR_XP = etree.XPath('(.//tei:author | .//author)[1]', namespaces=_NS)
+_DATE_XP = etree.XPath('(.//tei:date | .//date)[1]', namespaces=_NS)
+_LANG_XP = etree.XPath(
+    '((//tei:langUsage | //langUsage)[1])//*[local-name()="language"][1]', namespaces=_NS
+)
+
+# No entity expansion or network access; Perseus files can be very large
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+# How much of a document is_valid_tei_xml looks at; the root and teiHeader
+# open well within this
+_SNIFF_CHARS = 8192
 
 
 class TEIParser:
-    """Parse TEI-encoded plays (XML format used by scholarly editions)"""
+    """
+    Parser for TEI XML formatted plays.
+
+    Handles the structure used by Perseus Digital Library canonical repositories:
+    - https://github.com/PerseusDL/canonical-greekLit
+    - https://github.com/PerseusDL/canonical-latinLit
+    """
+
+    # TEI namespace (standard)
+    TEI_NS = _NS
+
+    def __init__(self):
+        pass
 
     def extract_monologues(
         self,
-        tei_xml: str,
+        xml_content: Union[str, etree._Element],
         min_words: int = 50,
         max_words: int = 500
     ) -> List[Dict]:
         """
-        Extract monologues from TEI-encoded play text.
+        Extract monologues from TEI XML play text.
 
-        TEI structure:
-        <sp who="#hamlet">
-            <speaker>Hamlet</speaker>
-            <l>To be, or not to be, that is the question:</l>
-            <l>Whether 'tis nobler in the mind to suffer</l>
-            ...
+        TEI structure for drama:
+        <sp who="#character"> (speech)
+          <speaker>Character Name</speaker>
+          <l>Line 1 of dialogue</l>
+          <l>Line 2 of dialogue</l>
+          ...
         </sp>
+
+        A string is streamed with iterparse, so memory stays proportional to
+        one speech rather than the file; a root from parse() is walked as is.
+
+        Args:
+            xml_content: TEI XML string, or a root already returned by parse()
+            min_words: Minimum word count for monologue
+            max_words: Maximum word count for monologue
+
+        Returns:
+            List of monologue dicts with character, text, word_count, stage_directions
         """
-        try:
-            tree = etree.fromstring(tei_xml.encode('utf-8'))
-        except Exception as e:
-            print(f"Error parsing TEI XML: {e}")
-            return []
+        if isinstance(xml_content, str):
+            try:
+                return self._collect_monologues(
+                    self._iter_speeches(xml_content), min_words, max_words
+                )
+            except etree.XMLSyntaxError:
+                # parse() retries without the XML declaration
+                xml_content = self.parse(xml_content)
+                if xml_content is None:
+                    return []
 
-        monologues = []
+        # Find all speeches (<sp> elements), with or without namespace
+        return self._collect_monologues(_SP_XP(xml_content), min_words, max_words)
+
+    def _iter_speeches(self, xml_content: str) -> Iterator[etree._Element]:
+        """
+        Stream <sp> elements from a TEI string.
 
-        # Define TEI namespace (common in TEI documents)
-        namespaces = {'tei': 'http://www.tei-c.org/ns/1.0'}
+        Each speech is cleared, along with everything before it, once the
+        caller moves on to the next one.
+        """
+        context = etree.iterparse(
+            BytesIO(xml_content.encode('utf-8')),
+            events=('end',),
+            tag=_SP_TAGS,
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+        )
+        for _, speech in context:
+            yield speech
 
-        # Try with namespace first
-        speeches = tree.xpath('//tei:sp', namespaces=namespaces)
+            speech.clear()
+            parent = speech.getparent()
+            if parent is not None:
+                while speech.getprevious() is not None:
+                    del parent[0]
 
-        # If no speeches found with namespace, try without
-        if not speeches:
-            speeches = tree.xpath('//sp')
+    def _collect_monologues(
+        self,
+        speeches: Iterable[etree._Element],
+        min_words: int,
+        max_words: int
+    ) -> List[Dict]:
+        """Turn <sp> elements into monologue dicts, filtering by word count."""
+        monologues = []
 
         for speech in speeches:
-            # Extract speaker
-            speaker_elem = speech.xpath('.//tei:speaker | .//speaker', namespaces=namespaces)
-            speaker = speaker_elem[0].text if speaker_elem and speaker_elem[0].text else "Unknown"
+            try:
+                # Get character name from speaker tag or 'who' attribute
+                character = self._extract_character(speech)
 
-            # Extract lines (could be <l>, <p>, or <ab> tags)
-            lines = speech.xpath('.//tei:l | .//tei:p | .//tei:ab | .//l | .//p | .//ab',
-                               namespaces=namespaces)
+                if not character:
+                    continue
 
-            text_lines = []
-            for line in lines:
-                line_text = self._get_element_text(line)
-                if line_text:
-                    text_lines.append(line_text)
+                # Extract speech text from <l> (line) elements, or <p> (paragraph)
+                # and <ab> (anonymous block) elements for prose speeches
+                lines = _LINES_XP(speech)
 
-            if not text_lines:
-                continue
+                if not lines:
+                    # Try paragraph / block format
+                    lines = _PARAS_XP(speech)
+
+                if not lines:
+                    continue
+
+                # Combine all lines
+                speech_text = []
+                stage_dirs = []
+
+                for line in lines:
+                    # Stage directions (usually in <stage> tags) are split
+                    # out of the spoken text in the same walk
+                    line_text, line_stages = self._split_line(line)
+                    stage_dirs.extend(line_stages)
+
+                    line_text = ' '.join(line_text.split())
+                    if line_text:
+                        speech_text.append(line_text)
 
-            full_text = '\n'.join(text_lines)
+                if not speech_text:
+                    continue
 
-            # Extract stage directions
-            stage_dirs = speech.xpath('.//tei:stage | .//stage', namespaces=namespaces)
-            directions = []
-            for sd in stage_dirs:
-                sd_text = self._get_element_text(sd)
-                if sd_text:
-                    directions.append(sd_text)
+                # One line per verse line / block, whitespace collapsed within each
+                full_text = '\n'.join(speech_text)
 
-            word_count = len(full_text.split())
+                # Count words
+                word_count = len(full_text.split())
 
-            # Filter by length
-            if min_words <= word_count <= max_words:
-                monologues.append({
-                    'character': self._clean_speaker_name(speaker),
-                    'text': full_text,
-                    'stage_directions': ' '.join(directions) if directions else None,
-                    'word_count': word_count
-                })
+                # Filter by word count
+                if min_words <= word_count <= max_words:
+                    monologue = {
+                        'character': character,
+                        'text': full_text,
+                        'word_count': word_count,
+                        'stage_directions': ' '.join(stage_dirs) if stage_dirs else None
+                    }
+                    monologues.append(monologue)
+
+            except Exception as e:
+                # Skip problematic speeches
+                continue
 
         return monologues
 
-    def _get_element_text(self, element) -> str:
-        """Extract clean text from XML element"""
+    def _split_line(self, line) -> Tuple[str, List[str]]:
+        """
+        Split a line (<l>, <p> or <ab>) into its spoken text and stage directions.
+
+        One walk over the subtree: <stage> elements go to the directions
+        (their tails stay with the line), all other text to the line.
+        """
+        parts: List[str] = []
+        stages: List[str] = []
+
+        def walk(elem) -> None:
+            if elem.text:
+                parts.append(elem.text)
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    pass  # comment or processing instruction: tail only
+                elif child.tag.rsplit('}', 1)[-1] == 'stage':
+                    stage_text = ''.join(child.itertext()).strip()
+                    if stage_text:
+                        stages.append(stage_text)
+                else:
+                    walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+
+        walk(line)
+        return ''.join(parts), stages
+
+    def _extract_character(self, speech_element) -> Optional[str]:
+        """
+        Extract character name from speech element.
+
+        Checks (in order):
+        1. <speaker> tag text
+        2. 'who' attribute
+        3. 'n' attribute (sometimes used for speaker label)
+        """
+        # Try <speaker> tag first (with and without namespace)
+        speakers = _SPEAKER_XP(speech_element)
+        if speakers and speakers[0].text:
+            return self._normalize_character_name(speakers[0].text)
+
+        # Try 'who' attribute
+        who = speech_element.get('who')
+        if who:
+            # Remove # prefix if present (TEI convention for ID references)
+            who = who.lstrip('#')
+            return self._normalize_character_name(who)
+
+        # Try 'n' attribute
+        n = speech_element.get('n')
+        if n:
+            return self._normalize_character_name(n)
+
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_character_name(name: str) -> str:
+        """
+        Normalize character name to Title Case.
+
+        Handles:
+        - ALL CAPS -> Title Case
+        - #character_id -> Character Id
+        - Underscores/hyphens -> spaces
+        """
+        if not name:
+            return "Unknown"
+
+        # Remove # prefix
+        name = name.lstrip('#')
+
+        # Replace underscores and hyphens with spaces
+        name = name.replace('_', ' ').replace('-', ' ')
+
+        # Convert to title case
+        name = name.title()
+
+        return name.strip()
+
+    def extract_play_metadata(self, xml_content: Union[str, etree._Element]) -> Dict:
+        """
+        Extract metadata from TEI XML header.
+
+        Accepts a TEI XML string or a root already returned by parse().
+
+        Returns dict with: title, author, date, language
+        """
+        metadata = {
+            'title': None,
+            'author': None,
+            'year': None,
+            'language': 'en'
+        }
+
+        root = self._as_root(xml_content)
+        if root is None:
+            return metadata
+
+        # Find teiHeader
+        headers = _HEADER_XP(root)
+
+        if headers:
+            header = headers[0]
+
+            # Extract title
+            title_elems = _TITLE_XP(header)
+            if title_elems and title_elems[0].text:
+                metadata['title'] = title_elems[0].text.strip()
+
+            # Extract author
+            author_elems = _AUTHOR_XP(header)
+            if author_elems and author_elems[0].text:
+                metadata['author'] = author_elems[0].text.strip()
+
+            # Extract date
+            date_elems = _DATE_XP(header)
+            if date_elems:
+                date_elem = date_elems[0]
+                # Try 'when' attribute first
+                when = date_elem.get('when')
+                if when:
+                    try:
+                        metadata['year'] = int(when.split('-')[0])
+                    except ValueError:
+                        pass
+                # Otherwise try text content
+                elif date_elem.text:
+                    try:
+                        year_match = re.search(r'\d{4}', date_elem.text)
+                        if year_match:
+                            metadata['year'] = int(year_match.group())
+                    except ValueError:
+                        pass
+
+            # Extract language
+            langs = _LANG_XP(root)
+            if langs:
+                lang_ident = langs[0].get('ident')
+                if lang_ident:
+                    metadata['language'] = lang_ident[:2]  # Take first 2 chars (e.g., 'eng' -> 'en')
+
+        return metadata
+
+    def is_valid_tei_xml(self, xml_content: str) -> bool:
+        """
+        Check if content is TEI XML.
+
+        Only the first _SNIFF_CHARS characters are pull-parsed: True if the
+        root is a TEI element or a teiHeader opens there.
+        """
+        parser = etree.XMLPullParser(events=('start',), resolve_entities=False, no_network=True)
         try:
-            # Get all text content, including nested elements
-            text = ''.join(element.itertext())
-            # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
-            return text
-        except Exception:
-            return ""
-
-    def _clean_speaker_name(self, name: str) -> str:
-        """Clean and normalize speaker name"""
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-
-        # Remove common stage direction prefixes
-        name = re.sub(r'^\[.*?\]\s*', '', name)
-
-        # Convert to title case if all caps
-        if name.isupper():
-            name = name.title()
-
-        return name
+            parser.feed(xml_content[:_SNIFF_CHARS].encode('utf-8'))
+            events = parser.read_events()
+            for _, elem in events:
+                if elem.tag.endswith('TEI'):
+                    return True
+                break
+            return any(elem.tag.endswith('teiHeader') for _, elem in events)
+        except etree.XMLSyntaxError:
+            return False
+
+    def parse(self, xml_content: str) -> Optional[etree._Element]:
+        """
+        Parse TEI XML into an lxml root element, or None if unparseable.
+
+        Callers needing both monologues and metadata should parse once and
+        pass the root to extract_monologues / extract_play_metadata.
+
+        Retries once without the XML declaration, which can disagree with
+        the UTF-8 bytes we feed the parser.
+        """
+        try:
+            return etree.fromstring(xml_content.encode('utf-8'), _XML_PARSER)
+        except (etree.XMLSyntaxError, ValueError):
+            xml_content = re.sub(r'<\?xml[^>]+\?>', '', xml_content)
+            try:
+                return etree.fromstring(xml_content.encode('utf-8'), _XML_PARSER)
+            except (etree.XMLSyntaxError, ValueError):
+                return None
+
+    def _as_root(self, xml_content: Union[str, etree._Element]) -> Optional[etree._Element]:
+        """Return a parsed root, parsing only if given a string."""
+        if isinstance(xml_content, str):
+            return self.parse(xml_content)
+        return xml_content
@@ -11,11 +11,18 @@ Extraction strategy:
 
 import io
 import json
+import logging
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type
 import pdfplumber
 from openai import OpenAI
+from pydantic import BaseModel, ConfigDict, Field
 from app.core.config import settings
+from app.services.extraction.pdf_parser import iter_pdf_pages
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -39,6 +46,9 @@ _DIALOGUE_SENTENCE = re.compile(r'^([A-Z][a-z].+)$')
 # Stage direction extraction
 _STAGE_DIR = re.compile(r'[\[\(]([^\]\)]+)[\]\)]')
 
+# Outermost JSON array in a free-form AI reply (calls without JSON mode)
+_JSON_ARRAY = re.compile(r'\[.*\]', re.DOTALL)
+
 # Headers to exclude from being treated as character names
 _EXCLUDE_PATTERNS = [
     re.compile(p, re.IGNORECASE) for p in [
@@ -159,7 +169,7 @@ def _preprocess_text(text: str) -> str:
     ftln_count = len(_LINE_NUMBER_PREFIX.findall(text[:5000]))
     if ftln_count >= 5:
         text = _LINE_NUMBER_PREFIX.sub('', text)
-        print(f"Stripped {ftln_count}+ FTLN/TLN line-number prefixes")
+        logger.info("Stripped %s+ FTLN/TLN line-number prefixes", ftln_count)
 
         # After stripping FTLN prefixes, also remove bare line reference numbers
         # that remain at the end of verse lines (e.g. "390", "395", "2145")
@@ -209,11 +219,28 @@ def _split_inline_speakers(text: str, character_names: List[str]) -> str:
 
     if result != text:
         hits = len(inline_re.findall(text))
-        print(f"Split {hits} inline speaker tag(s) before AI extraction")
+        logger.info("Split %s inline speaker tag(s) before AI extraction", hits)
 
     return result
 
 
+def _speaker_tag_names(text: str) -> List[str]:
+    """
+    Regex pre-scan for ALL-CAPS speaker tags on their own line ("HAMLET",
+    "LADY ANNE:"), used when no character list exists yet.
+
+    A name must appear at least twice, which keeps one-off headings out.
+    """
+    counts: Dict[str, int] = {}
+    for line in text.split('\n'):
+        m = _CHAR_ONLY.match(line.strip())
+        if m:
+            name = m.group(1).strip()
+            if name and not _is_excluded(name):
+                counts[name] = counts.get(name, 0) + 1
+    return [name for name, count in counts.items() if count >= 2]
+
+
 def _fix_merged_lines(scenes: List[Dict], character_names: List[str]) -> List[Dict]:
     """
     Post-processing: detect and split lines where the AI still merged multiple speakers.
@@ -290,7 +317,7 @@ def _fix_merged_lines(scenes: List[Dict], character_names: List[str]) -> List[Di
         fixed_scenes.append(scene_copy)
 
     if total_fixed:
-        print(f"Post-processing: fixed {total_fixed} merged line(s) in AI output")
+        logger.info("Post-processing: fixed %s merged line(s) in AI output", total_fixed)
 
     return fixed_scenes
 
@@ -324,7 +351,7 @@ def _strip_embedded_stage_directions(text: str) -> str:
         return text
     result = ' '.join(result_parts)
     if changed:
-        print(f"Bracketed embedded stage direction in: {text[:60]!r}")
+        logger.info("Bracketed embedded stage direction in: %r", text[:60])
     return result
 
 
@@ -561,15 +588,243 @@ def _recover_dropped_dialogue(scenes: List[Dict], raw_text: str) -> List[Dict]:
                 }
                 for ln in det_lines
             ]
-            print(
-                f"Lossless guard: recovered {len(det_lines) - len(ai_lines)} dropped "
-                f"line(s) for scene '{scene.get('title')}' "
-                f"({len(ai_lines)} -> {len(det_lines)})"
+            logger.info(
+                "Lossless guard: recovered %s dropped line(s) for scene %r (%s -> %s)",
+                len(det_lines) - len(ai_lines), scene.get("title"), len(ai_lines), len(det_lines),
             )
 
     return scenes
 
 
+# ---------------------------------------------------------------------------
+# Combined metadata + scenes responses
+# ---------------------------------------------------------------------------
+
+# Most script text sent in one AI scene-extraction call; the structural
+# splitter (script_structure.MAX_CHUNK_CHARS) keeps chunks within this
+AI_CHUNK_MAX_CHARS = 40000
+
+# Script text sent per Batch API row (matches the single-chunk AI window)
+BATCH_MAX_CHARS = AI_CHUNK_MAX_CHARS
+
+# Chunk extraction calls in flight at once (extract_chunk_ai retries 429s)
+CHUNK_CONCURRENCY = 5
+
+# Output token bounds for scene extraction replies
+SCENE_MIN_OUTPUT_TOKENS = 1000
+SCENE_MAX_OUTPUT_TOKENS = 16000
+
+
+def _scene_output_tokens(text_len: int) -> int:
+    """
+    max_tokens for a scene extraction reply over text_len characters.
+
+    The reply echoes every line of dialogue as JSON, so it can run to ~1.5x
+    the input text (about text_len // 2 tokens). Short excerpts get a small
+    reservation instead of a fixed multi-thousand-token floor.
+    """
+    return min(SCENE_MAX_OUTPUT_TOKENS, max(SCENE_MIN_OUTPUT_TOKENS, text_len // 2))
+
+
+# ---------------------------------------------------------------------------
+# Structured output schemas (sent as response_format, not spelled out in prompts)
+# ---------------------------------------------------------------------------
+
+class _StrictModel(BaseModel):
+    # Structured outputs require every object to forbid extra keys
+    model_config = ConfigDict(extra="forbid")
+
+
+class ScriptCharacter(_StrictModel):
+    name: str
+    gender: Literal["male", "female", "non-binary", "unknown"]
+    age_range: str = Field(description="e.g. 20s, 30-40, teen, elderly")
+    description: str = Field(description="10-15 words")
+
+
+class ScriptMetadata(_StrictModel):
+    title: str = Field(description="Title of the creative work, not the publisher or edition")
+    author: str = Field(description="Playwright or screenwriter, not the publisher or editor")
+    characters: List[ScriptCharacter]
+    genre: str = Field(description="Drama, Comedy, Tragedy, etc.")
+    estimated_length_minutes: int
+    synopsis: str = Field(description="2-3 sentences")
+
+
+class SceneLine(_StrictModel):
+    character: str = Field(description="Who speaks")
+    text: str = Field(description="Full dialogue text")
+    stage_direction: Optional[str]
+
+
+class Scene(_StrictModel):
+    title: str = Field(description="Brief descriptive title")
+    character_1: str = Field(description="Character with the most lines")
+    character_2: str = Field(description="Character with the second most lines")
+    description: str = Field(description="1-2 sentence summary")
+    setting: Optional[str]
+    tone: Literal[
+        "romantic", "comedic", "tragic", "tense", "dramatic",
+        "lighthearted", "mysterious", "melancholic",
+    ]
+    primary_emotions: List[str] = Field(description="1-3 emotions")
+    relationship_dynamic: Literal[
+        "romantic", "adversarial", "familial", "friendship",
+        "professional", "mentor-student", "strangers",
+    ]
+    lines: List[SceneLine]
+
+
+class SceneExtraction(_StrictModel):
+    scenes: List[Scene]
+
+
+class CombinedExtraction(_StrictModel):
+    metadata: ScriptMetadata
+    scenes: List[Scene]
+
+
+@lru_cache(maxsize=None)
+def _response_format(model: Type[BaseModel]) -> Dict:
+    """Strict json_schema response_format for a schema model."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "strict": True,
+            "schema": model.model_json_schema(),
+        },
+    }
+
+
+def _default_combined() -> Dict:
+    """Fallback result when combined extraction fails."""
+    return {
+        "metadata": {"title": "Untitled Script", "author": "Unknown", "characters": [], "genre": "Drama", "estimated_length_minutes": 60},
+        "scenes": []
+    }
+
+
+def _parse_combined(response_text: str) -> Optional[Dict]:
+    """
+    Parse a combined extraction reply into {"metadata", "scenes"}.
+
+    Replies follow the CombinedExtraction schema, so they parse directly.
+    Returns None if the reply is not a usable JSON object. Scenes without
+    lines or two named characters are dropped.
+    """
+    try:
+        result = json.loads(response_text)
+    except json.JSONDecodeError:
+        return None
+
+    # Validate structure
+    if not isinstance(result, dict) or "metadata" not in result or "scenes" not in result:
+        return None
+
+    # Validate scenes
+    result["scenes"] = [
+        s for s in result["scenes"]
+        if isinstance(s, dict) and s.get("lines") and s.get("character_1") and s.get("character_2")
+    ]
+    return result
+
+
+def _batch_windows(raw_text: str) -> List[str]:
+    """
+    Split a script into texts of at most BATCH_MAX_CHARS, one per batch row.
+
+    Whole structural chunks (scenes, or paragraph-split parts of unstructured
+    text) are packed in order, so nothing past the first window is dropped
+    and no scene is cut between two rows.
+    """
+    if len(raw_text) <= BATCH_MAX_CHARS:
+        return [raw_text]
+
+    from app.services.script_structure import detect_structure
+
+    windows: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for chunk in detect_structure(raw_text):
+        if current and current_len + chunk.char_count + 1 > BATCH_MAX_CHARS:
+            windows.append("\n".join(current))
+            current, current_len = [], 0
+        current.append(chunk.text)
+        current_len += chunk.char_count + 1
+    if current:
+        windows.append("\n".join(current))
+    return windows
+
+
+def _merge_combined(parts: List[Dict]) -> Dict:
+    """
+    Merge the combined results of one script's batch rows, in script order.
+
+    Metadata comes from the first part that found a title (the title page
+    opens the script), characters from every part, and scenes are
+    concatenated.
+    """
+    untitled = _default_combined()["metadata"]["title"]
+    metadata = dict(next(
+        (p["metadata"] for p in parts if p["metadata"].get("title") not in (None, "", untitled)),
+        parts[0]["metadata"],
+    ))
+
+    characters = list(metadata.get("characters") or [])
+    seen = {(c.get("name") or "").casefold() for c in characters}
+    for part in parts:
+        for character in part["metadata"].get("characters") or []:
+            key = (character.get("name") or "").casefold()
+            if key and key not in seen:
+                seen.add(key)
+                characters.append(character)
+    metadata["characters"] = characters
+
+    return {"metadata": metadata, "scenes": [s for p in parts for s in p["scenes"]]}
+
+
+def _iter_streamed_scenes(deltas: Iterable[str]) -> Iterator[Dict]:
+    """
+    Yield each scene of a streamed {"scenes": [...]} reply as soon as it closes.
+
+    Tracks bracket depth outside of JSON strings, buffering only the scene
+    currently being written. A scene cut off by the end of the stream is
+    never yielded, so truncated replies keep every complete scene.
+    """
+    depth = 0
+    in_string = escaped = False
+    item: List[str] = []
+
+    for delta in deltas:
+        for ch in delta:
+            if item:
+                item.append(ch)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+                continue
+            if ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+                # root object > scenes array > scene object
+                if depth == 3 and ch == "{":
+                    item = [ch]
+            elif ch in "}]":
+                depth -= 1
+                if depth == 2 and item:
+                    try:
+                        yield json.loads("".join(item))
+                    except json.JSONDecodeError:
+                        pass
+                    item = []
+
+
 # ---------------------------------------------------------------------------
 # ScriptParser class
 # ---------------------------------------------------------------------------
@@ -585,35 +840,52 @@ class ScriptParser:
             )
         self.client = OpenAI(api_key=api_key)
 
+    def extract_text(self, file_content: bytes, file_type: str) -> str:
+        """Extract text from a PDF or TXT upload."""
+        if file_type == "pdf":
+            return self.extract_text_from_pdf(file_content)
+        if file_type in ["txt", "text"]:
+            return self.extract_text_from_txt(file_content)
+        raise ValueError(f"Unsupported file type: {file_type}")
+
     def extract_text_from_pdf(self, file_content: bytes) -> str:
-        """Extract text from PDF file using pdfplumber"""
+        """
+        Extract text from PDF file using PyMuPDF.
+
+        Falls back to pdfplumber if MuPDF cannot open or read the file.
+        """
         try:
-            pdf_file = io.BytesIO(file_content)
-            text = ""
+            # Sequential: no worker processes on the request path.
+            # MuPDF ends each page with a newline; pages are joined below
+            pages = [text.rstrip("\n") for text in iter_pdf_pages(file_content)]
+        except Exception as e:
+            logger.warning("PyMuPDF failed (%s), falling back to pdfplumber", e)
+            pages = None
 
-            with pdfplumber.open(pdf_file) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n\n"
+        try:
+            if pages is None:
+                with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+                    # Pages with no characters (scans, figures) skip layout analysis
+                    pages = [page.extract_text() if page.chars else "" for page in pdf.pages]
 
-            return text.strip()
+            return "\n\n".join(text for text in pages if text).strip()
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {str(e)}")
 
     def extract_text_from_txt(self, file_content: bytes) -> str:
-        """Extract text from TXT file"""
+        """
+        Extract text from TXT file.
+
+        UTF-8 is decoded in one pass; a non-UTF-8 file stops that pass at the
+        first invalid byte and is decoded as Windows-1252 (a superset of
+        Latin-1's printable range that also covers smart quotes and dashes).
+        """
         try:
-            # Try UTF-8 first, fallback to other encodings
-            try:
-                return file_content.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    return file_content.decode('latin-1')
-                except UnicodeDecodeError:
-                    return file_content.decode('cp1252')
-        except Exception as e:
-            raise ValueError(f"Failed to parse text file: {str(e)}")
+            return file_content.decode('utf-8')
+        except UnicodeDecodeError:
+            # errors='replace' keeps this from failing on cp1252's five
+            # undefined bytes, so there is no third attempt
+            return file_content.decode('cp1252', errors='replace')
 
     def _detect_title_hint(self, text: str) -> Optional[str]:
         """
@@ -667,29 +939,16 @@ class ScriptParser:
         hint_line = ""
         if title_hint:
             hint_line = f'\nHINT: The title is likely "{title_hint}" based on the document header. Use this if it looks correct.\n'
-            print(f"Title hint detected: {title_hint}")
-
-        # Send first 8K chars (Folger PDFs have long preambles)
-        prompt = f"""Analyze this script and extract the following information in JSON format:
+            logger.info("Title hint detected: %s", title_hint)
 
+        # Send first 8K chars (Folger PDFs have long preambles); the field
+        # list lives in the ScriptMetadata schema, not the prompt
+        prompt = f"""Extract the title, author, characters, genre, runtime and synopsis of this script.
+{hint_line}
 Script text:
 ```
 {script_text[:8000]}
-```
-{hint_line}
-Please extract:
-1. title: The actual title of the play, screenplay, or script (e.g. "A Midsummer Night's Dream", "The Godfather"). Do NOT use publisher names, library names, or edition names (e.g. NOT "Folger Shakespeare Library", NOT "Project Gutenberg"). Look for the real creative work title.
-2. author: The playwright or screenwriter's name (e.g. "William Shakespeare", "Mario Puzo"). Not the publisher or editor.
-3. characters: Array of character objects with:
-   - name: Character name
-   - gender: "male", "female", "non-binary", or "unknown"
-   - age_range: Approximate age (e.g., "20s", "30-40", "teen", "elderly")
-   - description: Brief character description (10-15 words max)
-4. genre: Drama, Comedy, Tragedy, etc.
-5. estimated_length_minutes: Approximate runtime
-6. synopsis: A 2-3 sentence synopsis of the entire work. What is the story about? Keep it concise and compelling.
-
-Return ONLY valid JSON, no explanation."""
+```"""
 
         import time as _time
         default = {
@@ -706,24 +965,20 @@ Return ONLY valid JSON, no explanation."""
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.3,
-                    max_tokens=2000
+                    max_tokens=2000,
+                    response_format=_response_format(ScriptMetadata),
                 )
 
-                response_text = response.choices[0].message.content
-
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                return default
+                return json.loads(response.choices[0].message.content or "{}") or default
 
             except Exception as e:
                 is_rate_limit = "429" in str(e) or "rate_limit" in str(e).lower()
                 if is_rate_limit and attempt < 2:
                     wait = (attempt + 1) * 2
-                    print(f"Rate limited on metadata, retrying in {wait}s...")
+                    logger.warning("Rate limited on metadata, retrying in %ss...", wait)
                     _time.sleep(wait)
                     continue
-                print(f"Error extracting metadata: {e}")
+                logger.warning("Error extracting metadata: %s", e)
                 return default
 
         return default
@@ -791,7 +1046,7 @@ Return a JSON ARRAY of objects, one per scene, in the same order. Return ONLY va
                     max_tokens=max_tokens
                 )
                 response_text = response.choices[0].message.content or ""
-                json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+                json_match = _JSON_ARRAY.search(response_text)
                 if json_match:
                     metadata_list = json.loads(json_match.group())
                     if isinstance(metadata_list, list):
@@ -800,17 +1055,17 @@ Return a JSON ARRAY of objects, one per scene, in the same order. Return ONLY va
                         for idx, (orig_i, _) in enumerate(valid_entries):
                             if idx < len(metadata_list):
                                 result[orig_i] = metadata_list[idx]
-                        print(f"Batch analyzed {len(valid_entries)} scenes in 1 AI call")
+                        logger.info("Batch analyzed %s scenes in 1 AI call", len(valid_entries))
                         return result
                 break  # No valid JSON but no error — don't retry
             except Exception as e:
                 is_rate_limit = "429" in str(e) or "rate_limit" in str(e).lower()
                 if is_rate_limit and attempt < 2:
                     wait = (attempt + 1) * 2  # 2s, 4s
-                    print(f"Rate limited, retrying in {wait}s...")
+                    logger.warning("Rate limited, retrying in %ss...", wait)
                     _time.sleep(wait)
                     continue
-                print(f"Error in batch scene analysis: {e}")
+                logger.warning("Error in batch scene analysis: %s", e)
                 break
 
         return [self._default_metadata(sd) for sd in scenes]
@@ -873,7 +1128,7 @@ Return ONLY valid JSON array."""
                     max_tokens=min(8000, max(1000, len(scenes) * 200))
                 )
                 response_text = response.choices[0].message.content or ""
-                json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+                json_match = _JSON_ARRAY.search(response_text)
                 if json_match:
                     cleanup_list = json.loads(json_match.group())
                     if isinstance(cleanup_list, list):
@@ -884,7 +1139,7 @@ Return ONLY valid JSON array."""
                 if is_rate_limit and attempt < 2:
                     _time.sleep((attempt + 1) * 2)
                     continue
-                print(f"Error in scene cleanup: {e}")
+                logger.warning("Error in scene cleanup: %s", e)
                 break
 
         return scenes  # Return unmodified on failure
@@ -935,7 +1190,7 @@ Return ONLY valid JSON array."""
             cleaned.append(scene_copy)
 
         if total_removed:
-            print(f"AI cleanup: removed {total_removed} non-dialogue lines across {len(scenes)} scenes")
+            logger.info("AI cleanup: removed %s non-dialogue lines across %s scenes", total_removed, len(scenes))
 
         return cleaned
 
@@ -1029,7 +1284,7 @@ For each scene, extract:
 
 Return ONLY valid JSON array, no explanation."""
 
-        max_tokens = min(16000, max(8000, int(len(truncated_text) / 4 * 2)))
+        max_tokens = _scene_output_tokens(len(truncated_text))
 
         try:
             response = self.client.chat.completions.create(
@@ -1041,14 +1296,14 @@ Return ONLY valid JSON array, no explanation."""
 
             response_text = response.choices[0].message.content or ""
             finish_reason = response.choices[0].finish_reason
-            print(f"AI fallback extraction: {len(response_text)} chars, finish_reason: {finish_reason}")
+            logger.info("AI fallback extraction: %s chars, finish_reason: %s", len(response_text), finish_reason)
 
             if finish_reason == "length":
-                print("WARNING: AI fallback output was truncated — some scenes may be incomplete")
+                logger.warning("AI fallback output was truncated — some scenes may be incomplete")
 
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+            json_match = _JSON_ARRAY.search(response_text)
             if not json_match:
-                print(f"No JSON array found. First 500 chars: {response_text[:500]}")
+                logger.warning("No JSON array found. First 500 chars: %s", response_text[:500])
                 return []
 
             try:
@@ -1074,112 +1329,183 @@ Return ONLY valid JSON array, no explanation."""
                 if scene.get("lines") and scene.get("character_1") and scene.get("character_2"):
                     valid.append(scene)
 
-            print(f"AI fallback extracted {len(valid)} valid scenes")
+            logger.info("AI fallback extracted %s valid scenes", len(valid))
             return valid
 
         except Exception as e:
-            print(f"Error in AI fallback extraction: {e}")
+            logger.warning("Error in AI fallback extraction: %s", e)
             return []
 
     # ------------------------------------------------------------------
     # Combined extraction (small scripts — single AI call)
     # ------------------------------------------------------------------
 
-    def extract_combined(self, script_text: str) -> Dict:
+    def extract_combined(self, script_text: str, max_chars: int = 15000) -> Dict:
         """
-        Single AI call that extracts metadata + scenes for short scripts (< 5 pages).
+        Single AI call that extracts metadata + scenes in one response.
+
+        Used for short scripts (< 5 pages) and for longer scripts with no
+        act/scene structure, where metadata and scenes would otherwise be two
+        back-to-back requests over the same text.
+
+        Args:
+            script_text: Full script text
+            max_chars: How much of the script to send
+
         Returns {"metadata": {...}, "scenes": [...]}.
         """
         import time as _time
 
-        title_hint = self._detect_title_hint(script_text)
-        hint_line = f'\nHINT: The title is likely "{title_hint}".\n' if title_hint else ""
+        default = _default_combined()
 
-        prompt = f"""Analyze this script and extract BOTH metadata and dialogue scenes in ONE response.
-{hint_line}
-Script text:
-```
-{script_text[:15000]}
-```
+        for attempt in range(3):
+            try:
+                response = self.client.chat.completions.create(
+                    **self._combined_request(script_text, max_chars)
+                )
 
-Return a JSON object with two keys:
-
-1. "metadata": {{
-  "title": "The actual play/screenplay title",
-  "author": "Playwright or screenwriter name",
-  "characters": [
-    {{"name": "NAME", "gender": "male/female/non-binary/unknown", "age_range": "20s/30-40/teen/elderly", "description": "Brief 10-15 word description"}}
-  ],
-  "genre": "Drama/Comedy/Tragedy/etc",
-  "estimated_length_minutes": 60,
-  "synopsis": "2-3 sentence synopsis of the work"
-}}
+                result = _parse_combined(response.choices[0].message.content or "")
+                return result if result is not None else default
 
-2. "scenes": An array of dialogue scenes. For each scene:
-{{
-  "title": "Brief descriptive title",
-  "character_1": "Character with most lines",
-  "character_2": "Character with second most lines",
-  "description": "1-2 sentence summary",
-  "setting": "Where it takes place (null if unclear)",
-  "tone": "romantic/comedic/tragic/tense/dramatic/lighthearted/mysterious/melancholic",
-  "primary_emotions": ["emotion1", "emotion2"],
-  "relationship_dynamic": "romantic/adversarial/familial/friendship/professional/mentor-student/strangers",
-  "lines": [
-    {{"character": "NAME", "text": "Full dialogue text", "stage_direction": null}},
-    ...
-  ]
-}}
+            except Exception as e:
+                is_rate_limit = "429" in str(e) or "rate_limit" in str(e).lower()
+                if is_rate_limit and attempt < 2:
+                    _time.sleep((attempt + 1) * 2)
+                    continue
+                logger.warning("Error in combined extraction: %s", e)
+                return default
+
+        return default
+
+    def _combined_request(self, script_text: str, max_chars: int = 15000) -> Dict:
+        """Chat completion request body for extract_combined (also used per batch row)."""
+        title_hint = self._detect_title_hint(script_text)
+        hint_line = f'\nHINT: The title is likely "{title_hint}".\n' if title_hint else ""
 
+        # Same speaker-turn repair extract_chunk_ai does; there is no character
+        # list before this call, so names come from the speaker tags themselves
+        text = script_text[:max_chars]
+        text = _split_inline_speakers(text, _speaker_tag_names(text))
+
+        prompt = f"""Extract this script's metadata and its dialogue scenes.
+{hint_line}
 RULES for scenes:
 - Extract every stretch of dialogue between 2+ characters.
 - Include ALL spoken dialogue lines — do NOT skip, summarize, or paraphrase.
 - Do NOT include stage directions as dialogue text.
 - Merge consecutive lines by the same character into one entry.
 - Only extract scenes with at least 4 lines of dialogue.
+- CRITICAL: Each line in the "lines" array must belong to EXACTLY ONE character. Never merge multiple characters' dialogue into a single line entry.
+- If a third character speaks between character_1 and character_2, include that line with the correct character name — do NOT fold it into another character's line.
+- Every "character" field in a line must match the actual speaker. Do not attribute one character's words to another.
 
-Return ONLY valid JSON."""
+Script text:
+```
+{text}
+```"""
 
-        default = {
-            "metadata": {"title": "Untitled Script", "author": "Unknown", "characters": [], "genre": "Drama", "estimated_length_minutes": 60},
-            "scenes": []
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.2,
+            "max_tokens": _scene_output_tokens(min(len(script_text), max_chars)),
+            "response_format": _response_format(CombinedExtraction),
         }
 
-        for attempt in range(3):
-            try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    max_tokens=min(16000, max(6000, len(script_text) // 2))
-                )
+    # ------------------------------------------------------------------
+    # Batch API (non-interactive bulk ingestion)
+    # ------------------------------------------------------------------
 
-                response_text = response.choices[0].message.content or ""
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if not json_match:
-                    return default
-
-                result = json.loads(json_match.group())
-                # Validate structure
-                if "metadata" not in result or "scenes" not in result:
-                    return default
-
-                # Validate scenes
-                result["scenes"] = [
-                    s for s in result["scenes"]
-                    if isinstance(s, dict) and s.get("lines") and s.get("character_1") and s.get("character_2")
-                ]
-                return result
+    def submit_batch(self, scripts: List[Tuple[str, bytes, str]]) -> str:
+        """
+        Queue scripts for combined metadata + scene extraction via the OpenAI
+        Batch API (half the token price, results within 24h).
 
-            except Exception as e:
-                is_rate_limit = "429" in str(e) or "rate_limit" in str(e).lower()
-                if is_rate_limit and attempt < 2:
-                    _time.sleep((attempt + 1) * 2)
+        For back-catalog ingestion only; interactive uploads keep using
+        parse_script. Each row gets the same request as extract_combined.
+        Scripts longer than BATCH_MAX_CHARS are split at structural chunk
+        boundaries into several rows ("{custom_id}:{index}"), which
+        collect_batch merges back into one result.
+
+        Args:
+            scripts: (custom_id, file_content, file_type) per script; custom_id
+                     is echoed back by collect_batch
+
+        Returns:
+            The batch id to pass to collect_batch
+        """
+        rows = []
+        for custom_id, file_content, file_type in scripts:
+            raw_text = self.extract_text(file_content, file_type)
+            for index, window in enumerate(_batch_windows(raw_text)):
+                rows.append(json.dumps({
+                    "custom_id": f"{custom_id}:{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._combined_request(window, max_chars=BATCH_MAX_CHARS),
+                }))
+
+        batch_file = self.client.files.create(
+            file=("scripts.jsonl", "\n".join(rows).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted batch %s with %s scripts in %s rows", batch.id, len(scripts), len(rows))
+        return batch.id
+
+    def collect_batch(self, batch_id: str) -> Optional[Dict[str, Dict]]:
+        """
+        Fetch results of a batch submitted with submit_batch.
+
+        Returns None while the batch is still running, otherwise
+        {custom_id: {"metadata": {...}, "scenes": [...]}} with the rows of a
+        split script merged in order. Rows that failed or returned unusable
+        JSON get the same default as extract_combined.
+
+        Raises:
+            ValueError: If the batch failed, expired or was cancelled
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing"):
+            return None
+        if batch.status != "completed":
+            raise ValueError(f"Batch {batch_id} ended with status {batch.status}")
+
+        results: Dict[str, Dict] = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
                     continue
-                print(f"Error in combined extraction: {e}")
-                return default
+                row = json.loads(line)
+                try:
+                    content = row["response"]["body"]["choices"][0]["message"]["content"] or ""
+                except (KeyError, IndexError, TypeError):
+                    content = ""
+                parsed = _parse_combined(content)
+                results[row["custom_id"]] = parsed if parsed is not None else _default_combined()
+
+        # Rows that errored outright only appear in the error file
+        if batch.error_file_id:
+            errors = self.client.files.content(batch.error_file_id).text
+            for line in errors.splitlines():
+                if line.strip():
+                    results.setdefault(json.loads(line)["custom_id"], _default_combined())
+
+        # Row ids are "{custom_id}:{index}"; reassemble each script in order
+        parts: Dict[str, List[Tuple[int, Dict]]] = {}
+        for row_id, result in results.items():
+            custom_id, _, index = row_id.rpartition(":")
+            parts.setdefault(custom_id, []).append((int(index), result))
 
-        return default
+        return {
+            custom_id: _merge_combined([result for _, result in sorted(indexed, key=lambda p: p[0])])
+            for custom_id, indexed in parts.items()
+        }
 
     # ------------------------------------------------------------------
     # Main extraction pipeline
@@ -1193,7 +1519,7 @@ Return ONLY valid JSON."""
         Uses AI to understand dialogue, stage directions, and character attribution.
         """
         def progress(msg):
-            print(msg)
+            logger.info(msg)
             if on_progress:
                 on_progress(msg)
 
@@ -1201,7 +1527,11 @@ Return ONLY valid JSON."""
             return []
 
         progress("Extracting dialogue with AI (this takes a few seconds)")
-        scenes = self.extract_chunk_ai(text, characters, script_title, script_author)
+        scenes = self.extract_chunk_ai(
+            text, characters, script_title, script_author,
+            on_scene=lambda scene: progress(f"Found \"{scene.get('title', 'Untitled')}\""),
+            cancel_event=cancel_event,
+        )
 
         if cancel_event and cancel_event.is_set():
             return []
@@ -1210,11 +1540,20 @@ Return ONLY valid JSON."""
         return scenes
 
     def extract_chunk_ai(self, chunk_text: str, characters: List[Dict],
-                         script_title: str = "", script_author: str = "") -> List[Dict]:
+                         script_title: str = "", script_author: str = "",
+                         on_scene=None, cancel_event=None) -> List[Dict]:
         """
         Use AI to extract dialogue scenes (2+ characters) from a single structural chunk.
         AI understands stage directions, verse format, character attribution natively.
 
+        The reply is streamed and parsed scene by scene, so a cancelled
+        extraction stops generating immediately.
+
+        Args:
+            on_scene: Optional callback(scene: dict) fired as each scene
+                      arrives, before the whole reply is done.
+            cancel_event: Optional threading.Event; aborts the stream when set.
+
         Returns list of scene dicts ready for DB insertion.
         """
         import time as _time
@@ -1223,7 +1562,7 @@ Return ONLY valid JSON."""
         char_hint = ', '.join(character_names) if character_names else "(auto-detect)"
 
         # Truncate very large chunks (shouldn't happen after structural splitting)
-        text = chunk_text[:40000]
+        text = chunk_text[:AI_CHUNK_MAX_CHARS]
 
         # Fix collapsed line breaks from PDF extraction: "dialogue. HAMLET response."
         # → "dialogue.\nHAMLET\nresponse." so the AI sees clean speaker turns.
@@ -1246,33 +1585,15 @@ RULES:
 - CRITICAL: Each line in the "lines" array must belong to EXACTLY ONE character. Never merge multiple characters' dialogue into a single line entry.
 - If a third character speaks between character_1 and character_2, include that line with the correct character name — do NOT fold it into another character's line.
 - Every "character" field in a line must match the actual speaker. Do not attribute one character's words to another.
+- If no scenes exist, return an empty "scenes" list.
 
 Script text:
 ```
 {text}
-```
-
-For each scene found, return a JSON object:
-{{
-  "title": "Brief descriptive title",
-  "character_1": "Character with the most lines",
-  "character_2": "Character with the second most lines",
-  "description": "1-2 sentence summary",
-  "setting": "Where it takes place (null if unclear)",
-  "tone": "romantic/comedic/tragic/tense/dramatic/lighthearted/mysterious/melancholic",
-  "primary_emotions": ["emotion1", "emotion2"],
-  "relationship_dynamic": "romantic/adversarial/familial/friendship/professional/mentor-student/strangers",
-  "lines": [
-    {{"character": "NAME", "text": "Full dialogue text", "stage_direction": null}},
-    ...
-  ]
-}}
+```"""
 
-Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
-
-        # Output needs to be large enough to hold all dialogue as JSON.
-        # Rule of thumb: output can be ~1.5x the input text length (dialogue + JSON overhead).
-        max_tokens = min(16000, max(6000, len(text) // 2))
+        # Output needs to be large enough to hold all dialogue as JSON
+        max_tokens = _scene_output_tokens(len(text))
         current_text = text
 
         for attempt in range(4):
@@ -1282,45 +1603,48 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
                     retry_prompt = prompt.replace(f"```\n{text}\n```", f"```\n{current_text}\n```")
                 else:
                     retry_prompt = prompt
-                response = self.client.chat.completions.create(
+                stream = self.client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": retry_prompt}],
                     temperature=0.2,
-                    max_tokens=max_tokens
+                    max_tokens=max_tokens,
+                    response_format=_response_format(SceneExtraction),
+                    stream=True,
                 )
-                response_text = response.choices[0].message.content or ""
-                finish_reason = response.choices[0].finish_reason
+                finish_reason = None
+
+                def deltas():
+                    nonlocal finish_reason
+                    for chunk in stream:
+                        if cancel_event and cancel_event.is_set():
+                            stream.close()
+                            return
+                        if not chunk.choices:
+                            continue
+                        choice = chunk.choices[0]
+                        finish_reason = choice.finish_reason or finish_reason
+                        if choice.delta.content:
+                            yield choice.delta.content
+
+                # Validate as scenes arrive: must have lines and two characters.
+                # A reply cut off mid-array keeps its complete scenes.
+                valid = []
+                for scene in _iter_streamed_scenes(deltas()):
+                    if isinstance(scene, dict) and scene.get("lines") and scene.get("character_1") and scene.get("character_2"):
+                        valid.append(scene)
+                        if on_scene:
+                            on_scene(scene)
+
+                if cancel_event and cancel_event.is_set():
+                    return []
 
                 # If output was truncated, retry with half the input text
                 if finish_reason == "length" and attempt < 2:
-                    print(f"AI output truncated (chunk {len(current_text)} chars), retrying with half")
+                    logger.warning("AI output truncated (chunk %s chars), retrying with half", len(current_text))
                     current_text = current_text[:len(current_text) // 2]
-                    max_tokens = min(16000, max(6000, len(current_text) // 2))
+                    max_tokens = _scene_output_tokens(len(current_text))
                     continue
 
-                json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-                if not json_match:
-                    return []
-
-                raw = json_match.group()
-                try:
-                    scenes = json.loads(raw)
-                except json.JSONDecodeError:
-                    # Try to salvage truncated JSON
-                    last_brace = raw.rfind('}')
-                    if last_brace > 0:
-                        try:
-                            scenes = json.loads(raw[:last_brace + 1].rstrip().rstrip(',') + ']')
-                        except json.JSONDecodeError:
-                            return []
-                    else:
-                        return []
-
-                # Validate: must have lines and two characters
-                valid = [
-                    s for s in scenes
-                    if isinstance(s, dict) and s.get("lines") and s.get("character_1") and s.get("character_2")
-                ]
                 # Post-process: split any lines where AI still merged multiple speakers
                 valid = _fix_merged_lines(valid, character_names)
                 return valid
@@ -1330,7 +1654,7 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
                 if is_rate_limit and attempt < 2:
                     _time.sleep((attempt + 1) * 2)
                     continue
-                print(f"Error in AI chunk extraction: {e}")
+                logger.warning("Error in AI chunk extraction: %s", e)
                 return []
 
         return []
@@ -1341,10 +1665,11 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
         """
         Extract two-person scenes from each structural chunk using AI.
         Each chunk (act/scene) is sent to AI which understands dialogue,
-        stage directions, verse format, etc.
+        stage directions, verse format, etc. Up to CHUNK_CONCURRENCY chunks
+        are in flight at once.
         """
         def progress(msg):
-            print(msg)
+            logger.info(msg)
             if on_progress:
                 on_progress(msg)
 
@@ -1368,27 +1693,47 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
             progress(f"Skipped {skipped} sections with no dialogue")
         progress(f"Extracting scenes from {len(chunks_with_dialogue)} sections")
 
-        for i, chunk in enumerate(chunks_with_dialogue):
-            if cancel_event and cancel_event.is_set():
-                progress("Extraction cancelled")
-                break
+        labels = [
+            chunk.act_label or chunk.scene_label or f"section {i+1}"
+            for i, chunk in enumerate(chunks_with_dialogue)
+        ]
 
-            chunk_label = chunk.act_label or chunk.scene_label or f"section {i+1}"
+        def extract(chunk, chunk_label):
+            if cancel_event and cancel_event.is_set():
+                return []
             progress(f"Extracting dialogue from {chunk_label}")
-
-            scenes = self.extract_chunk_ai(
-                chunk.text, characters, script_title, script_author
+            return self.extract_chunk_ai(
+                chunk.text, characters, script_title, script_author,
+                on_scene=lambda scene: progress(f"Found \"{scene.get('title', 'Untitled')}\" in {chunk_label}"),
+                cancel_event=cancel_event,
             )
 
-            # Tag each scene with its structural position
-            for scene in scenes:
-                scene["act"] = chunk.act_label
-                scene["scene_number"] = chunk.scene_label
+        # Chunks are independent, so run the AI calls concurrently; results
+        # are collected in script order
+        with ThreadPoolExecutor(max_workers=CHUNK_CONCURRENCY) as executor:
+            futures = [
+                executor.submit(extract, chunk, chunk_label)
+                for chunk, chunk_label in zip(chunks_with_dialogue, labels)
+            ]
+
+            for chunk, chunk_label, future in zip(chunks_with_dialogue, labels, futures):
+                if cancel_event and cancel_event.is_set():
+                    progress("Extraction cancelled")
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+                scenes = future.result()
 
-            if scenes:
-                progress(f"Found {len(scenes)} scene(s) in {chunk_label}")
+                # Tag each scene with its structural position
+                for scene in scenes:
+                    scene["act"] = chunk.act_label
+                    scene["scene_number"] = chunk.scene_label
 
-            all_scenes.extend(scenes)
+                if scenes:
+                    progress(f"Found {len(scenes)} scene(s) in {chunk_label}")
+
+                all_scenes.extend(scenes)
 
         return all_scenes
 
@@ -1400,7 +1745,7 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
         Much faster than full AI extraction — 2-3 AI calls total vs ~20.
         """
         def progress(msg):
-            print(msg)
+            logger.info(msg)
             if on_progress:
                 on_progress(msg)
 
@@ -1470,7 +1815,7 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
         from app.services.script_structure import detect_structure
 
         def progress(msg):
-            print(msg)
+            logger.info(msg)
             if on_progress:
                 on_progress(msg)
 
@@ -1480,12 +1825,7 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
 
         # Step 1: Extract text
         progress(f"Opening {filename}")
-        if file_type == "pdf":
-            raw_text = self.extract_text_from_pdf(file_content)
-        elif file_type in ["txt", "text"]:
-            raw_text = self.extract_text_from_txt(file_content)
-        else:
-            raise ValueError(f"Unsupported file type: {file_type}")
+        raw_text = self.extract_text(file_content, file_type)
 
         if not raw_text or len(raw_text) < 100:
             raise ValueError("File appears to be empty or too short")
@@ -1504,16 +1844,7 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
             characters = metadata.get("characters", [])
             progress(f"Found {len(characters)} characters, {len(scenes)} scenes in \"{script_title}\"")
         else:
-            # Step 2: Extract metadata (title, author, characters)
-            check_cancelled()
-            progress("Learning who the characters are")
-            metadata = self.extract_script_metadata(raw_text)
-            script_title = metadata.get("title", "")
-            script_author = metadata.get("author", "")
-            characters = metadata.get('characters', [])
-            progress(f"Found {len(characters)} characters in \"{script_title}\"")
-
-            # Step 3: Detect act/scene structure (pure regex, zero AI cost)
+            # Step 2: Detect act/scene structure (pure regex, zero AI cost)
             check_cancelled()
             progress("Mapping out the acts and scenes")
             chunks = detect_structure(raw_text)
@@ -1524,30 +1855,52 @@ Return a JSON ARRAY. If no scenes exist, return []. Return ONLY valid JSON."""
             else:
                 progress("No act/scene structure found, treating as single script")
 
-            # Step 4: Extract scenes
-            check_cancelled()
-            progress("Pulling every line of dialogue")
-
-            if mode == "quick":
-                scenes = self.extract_scenes_quick(
-                    chunks, characters, script_title, script_author,
-                    on_progress=on_progress, cancel_event=cancel_event
-                )
-                if not scenes:
-                    progress("No scenes found with regex, falling back to AI extraction")
-                    mode = "full"
-
-            if mode == "full":
-                if has_structure:
-                    scenes = self.extract_scenes_chunked(
+            if mode == "full" and not has_structure:
+                # Unstructured: scenes come from the whole text anyway, so get
+                # metadata in the same call rather than a second round-trip
+                check_cancelled()
+                progress("Analyzing script and extracting scenes")
+                combined = self.extract_combined(raw_text, max_chars=AI_CHUNK_MAX_CHARS)
+                metadata = combined.get("metadata", {})
+                script_title = metadata.get("title", "")
+                characters = metadata.get("characters", [])
+                character_names = [c['name'] for c in characters if c.get('name')]
+                scenes = _fix_merged_lines(combined.get("scenes", []), character_names)
+                progress(f"Found {len(characters)} characters, {len(scenes)} scenes in \"{script_title}\"")
+            else:
+                # Step 3: Extract metadata (title, author, characters)
+                check_cancelled()
+                progress("Learning who the characters are")
+                metadata = self.extract_script_metadata(raw_text)
+                script_title = metadata.get("title", "")
+                script_author = metadata.get("author", "")
+                characters = metadata.get('characters', [])
+                progress(f"Found {len(characters)} characters in \"{script_title}\"")
+
+                # Step 4: Extract scenes
+                check_cancelled()
+                progress("Pulling every line of dialogue")
+
+                if mode == "quick":
+                    scenes = self.extract_scenes_quick(
                         chunks, characters, script_title, script_author,
                         on_progress=on_progress, cancel_event=cancel_event
                     )
-                else:
-                    scenes = self.extract_scenes_from_text(
-                        raw_text, characters, script_title, script_author,
-                        on_progress=on_progress, cancel_event=cancel_event
-                    )
+                    if not scenes:
+                        progress("No scenes found with regex, falling back to AI extraction")
+                        mode = "full"
+
+                if mode == "full":
+                    if has_structure:
+                        scenes = self.extract_scenes_chunked(
+                            chunks, characters, script_title, script_author,
+                            on_progress=on_progress, cancel_event=cancel_event
+                        )
+                    else:
+                        scenes = self.extract_scenes_from_text(
+                            raw_text, characters, script_title, script_author,
+                            on_progress=on_progress, cancel_event=cancel_event
+                        )
 
         # Lossless guard: repair any dialogue the LLM dropped/merged, using the
         # deterministic parser as the source of truth (before the length filter, so
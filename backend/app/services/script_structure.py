@@ -62,8 +62,10 @@ _ROMAN_MAP = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
 _WORD_MAP = {'ONE': 1, 'TWO': 2, 'THREE': 3, 'FOUR': 4, 'FIVE': 5,
              'SIX': 6, 'SEVEN': 7, 'EIGHT': 8, 'NINE': 9}
 
-# Max chunk size before splitting at paragraph boundaries
-MAX_CHUNK_CHARS = 60000
+# Max chunk size before splitting at paragraph boundaries; matches the text
+# window of one AI extraction call (script_parser.AI_CHUNK_MAX_CHARS), so no
+# chunk is silently truncated
+MAX_CHUNK_CHARS = 40000
 
 
 def _normalize_number(value: str) -> str:
@@ -123,26 +125,28 @@ def _split_large_chunk(chunk: StructuralChunk) -> List[StructuralChunk]:
 
     parts = []
     paragraphs = re.split(r'\n\s*\n', chunk.text)
-    current_text = ""
+    # Paragraphs of the part being built, joined once when it is emitted
+    current: List[str] = []
+    current_len = 0
 
-    for para in paragraphs:
-        if len(current_text) + len(para) + 2 > MAX_CHUNK_CHARS and current_text:
+    def emit():
+        text = "\n\n".join(current).strip()
+        if text:
             parts.append(StructuralChunk(
                 act_label=chunk.act_label,
                 scene_label=chunk.scene_label,
-                text=current_text.strip(),
+                text=text,
             ))
-            current_text = para
-        else:
-            current_text += ("\n\n" + para if current_text else para)
 
-    if current_text.strip():
-        parts.append(StructuralChunk(
-            act_label=chunk.act_label,
-            scene_label=chunk.scene_label,
-            text=current_text.strip(),
-        ))
+    for para in paragraphs:
+        if current_len + len(para) + 2 > MAX_CHUNK_CHARS and current:
+            emit()
+            current, current_len = [para], len(para)
+        else:
+            current_len += len(para) + (2 if current else 0)
+            current.append(para)
 
+    emit()
     return parts
 
 
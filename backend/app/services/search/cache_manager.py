@@ -3,10 +3,15 @@
 import hashlib
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +43,34 @@ logger = logging.getLogger(__name__)
 # (was King Lear x5 / The Intruder x4 for "senior man").
 # v13: film/TV minimum-word gate — pieces under 75 words are sub-monologue clips
 # and no longer surface in search/discover (TV corpus was 80% under 75).
-CACHE_VERSION = "13"
+# v14: Redis payloads are orjson bytes; embeddings are raw float32 bytes
+# (not readable as the old JSON lists, so every key moves).
+CACHE_VERSION = "14"
+
+# Upper bound on Redis connections per process. The sync client (request
+# threads) and the async client (event loop) each keep their own pool, so
+# each pool gets half
+REDIS_MAX_CONNECTIONS = 50
+_REDIS_POOL_MAX_CONNECTIONS = REDIS_MAX_CONNECTIONS // 2
+
+# Level 1 (in-process) cache: entries expire after MEMORY_TTL seconds and the
+# least recently used are evicted past the per-kind cap. Sized for a 512 MB
+# instance: ~500 search (1536-d) + ~200 film/TV (3072-d) embeddings, and
+# parsed filters at ~5 KB each.
+MEMORY_TTL = 3600
+MEMORY_MAX_ENTRIES = {"embedding": 700, "filters": 1000}
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache payload (numpy scores/floats included) to JSON bytes."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 class CacheManager:
     """
     Multi-level caching for monologue search.
 
-    Level 1: In-memory LRU cache (@lru_cache decorators)
+    Level 1: In-process TTL-LRU (embeddings, parsed filters; always on)
     Level 2: Redis cache (if available)
     Level 3: Database cache (query_embeddings table)
 
@@ -59,11 +84,13 @@ class CacheManager:
         # Level 2: Redis cache (optional)
         # Supports both Upstash (REDIS_URL) and standard Redis (REDIS_HOST/PORT)
         self.redis_client = None
+        self.aredis = None
         self.redis_enabled = False
 
         try:
             import os
             import redis  # type: ignore[import-untyped]
+            import redis.asyncio as aioredis  # type: ignore[import-untyped]
 
             # Try Upstash Redis URL first (recommended for serverless)
             redis_url = os.getenv("REDIS_URL") or os.getenv("UPSTASH_REDIS_URL")
@@ -71,22 +98,29 @@ class CacheManager:
             if redis_url:
                 # Upstash or any Redis URL (redis://... or rediss://...)
                 # ssl_cert_reqs=None needed for macOS local dev (production has proper certs)
-                self.redis_client = redis.Redis.from_url(
-                    redis_url,
+                conn_kwargs: Dict[str, Any] = dict(
                     decode_responses=False,
                     socket_connect_timeout=2,
                     ssl_cert_reqs=None,
+                    max_connections=_REDIS_POOL_MAX_CONNECTIONS,
                 )
+                pool = redis.ConnectionPool.from_url(redis_url, **conn_kwargs)
+                self.aredis = aioredis.Redis.from_url(redis_url, **conn_kwargs)
             else:
                 # Fallback to host/port config
                 from app.core.config import settings
-                self.redis_client = redis.Redis(
+                conn_kwargs = dict(
                     host=getattr(settings, "REDIS_HOST", "localhost"),
                     port=getattr(settings, "REDIS_PORT", 6379),
                     db=0,
                     decode_responses=False,
                     socket_connect_timeout=2,
+                    max_connections=_REDIS_POOL_MAX_CONNECTIONS,
                 )
+                pool = redis.ConnectionPool(**conn_kwargs)
+                self.aredis = aioredis.Redis(**conn_kwargs)
+
+            self.redis_client = redis.Redis(connection_pool=pool)
 
             # Test connection
             self.redis_client.ping()
@@ -95,6 +129,11 @@ class CacheManager:
         except Exception as e:
             logger.debug("Redis not available (using memory cache only): %s", e)
             self.redis_enabled = False
+            self.aredis = None
+
+        # Level 1: per-process memory, one LRU per kind of entry
+        self._memory: Dict[str, OrderedDict] = {kind: OrderedDict() for kind in MEMORY_MAX_ENTRIES}
+        self._memory_lock = threading.Lock()
 
         # Metrics
         self.metrics = {
@@ -117,14 +156,44 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        cache_data = {
-            "v": CACHE_VERSION,
-            "query": query.lower().strip(),
-            "filters": sorted(filters.items()) if filters else [],
-        }
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        key_hash = hashlib.md5(cache_str.encode()).hexdigest()
-        return f"{prefix}:{key_hash}"
+        # Fed straight into BLAKE2b (no intermediate JSON document); the
+        # separator bytes keep "a"+"bc" and "ab"+"c" from colliding
+        h = hashlib.blake2b(digest_size=16)
+        h.update(CACHE_VERSION.encode())
+        h.update(b"\x00")
+        h.update(query.lower().strip().encode())
+        if filters:
+            for k, v in sorted(filters.items()):
+                h.update(b"\x00")
+                h.update(k.encode())
+                h.update(b"\x01")
+                h.update(str(v).encode())
+        return f"{prefix}:{h.hexdigest()}"
+
+    # ==================== In-Process Memory Cache ====================
+
+    def _memory_get(self, kind: str, cache_key: str) -> Any:
+        """Return a live Level 1 entry (marking it recently used) or None."""
+        cache = self._memory[kind]
+        with self._memory_lock:
+            entry = cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del cache[cache_key]
+                return None
+            cache.move_to_end(cache_key)
+            return value
+
+    def _memory_set(self, kind: str, cache_key: str, value: Any):
+        """Store a Level 1 entry, evicting the least recently used past the cap."""
+        cache = self._memory[kind]
+        with self._memory_lock:
+            cache[cache_key] = (time.monotonic() + MEMORY_TTL, value)
+            cache.move_to_end(cache_key)
+            while len(cache) > MEMORY_MAX_ENTRIES[kind]:
+                cache.popitem(last=False)
 
     # ==================== Search Results Cache ====================
 
@@ -145,11 +214,11 @@ class CacheManager:
             cached = self.redis_client.get(cache_key)
             if cached:
                 self.metrics["hits"]["redis"] += 1
-                print(f"✓ Cache HIT (search): {query[:50]}")
-                return json.loads(cached)
+                logger.debug("Cache HIT (search): %s", query[:50])
+                return orjson.loads(cached)
 
         except Exception as e:
-            print(f"Cache get error: {e}")
+            logger.warning("Cache get error: %s", e)
 
         self.metrics["misses"] += 1
         return None
@@ -177,44 +246,57 @@ class CacheManager:
         cache_key = self._generate_cache_key("search", query, filters)
 
         try:
-            # Serialize results
-            serialized = json.dumps(results)
-            self.redis_client.setex(cache_key, ttl, serialized)
+            self.redis_client.setex(cache_key, ttl, _dumps(results))
             self.metrics["sets"] += 1
-            print(f"✓ Cache SET (search): {query[:50]}")
+            logger.debug("Cache SET (search): %s", query[:50])
 
         except Exception as e:
-            print(f"Cache set error: {e}")
+            logger.warning("Cache set error: %s", e)
 
     # ==================== Embedding Cache ====================
 
-    def get_embedding(self, query: str) -> Optional[List[float]]:
+    def lookup_embedding(self, query: str) -> Tuple[Optional[List[float]], Optional[str]]:
         """
-        Get cached embedding for query.
+        Get cached embedding for query along with the level that served it.
 
         Checks:
-        1. Redis cache (fast)
-        2. Database cache (slower but persistent)
+        1. In-process memory (fastest, per worker)
+        2. Redis cache (shared; a hit is promoted to memory)
 
         Returns:
-            Embedding vector or None
+            (embedding, "memory" | "redis") or (None, None)
         """
         cache_key = self._generate_cache_key("embedding", query)
 
-        # Try Redis first
+        embedding = self._memory_get("embedding", cache_key)
+        if embedding is not None:
+            self.metrics["hits"]["memory"] += 1
+            return embedding, "memory"
+
         if self.redis_enabled and self.redis_client is not None:
             try:
                 cached = self.redis_client.get(cache_key)
                 if cached:
                     self.metrics["hits"]["redis"] += 1
-                    print(f"✓ Cache HIT (embedding): {query[:50]}")
-                    return json.loads(cached)
+                    logger.debug("Cache HIT (embedding): %s", query[:50])
+                    embedding = np.frombuffer(cached, dtype=np.float32).tolist()
+                    self._memory_set("embedding", cache_key, embedding)
+                    return embedding, "redis"
 
             except Exception as e:
-                print(f"Embedding cache get error: {e}")
+                logger.warning("Embedding cache get error: %s", e)
 
         self.metrics["misses"] += 1
-        return None
+        return None, None
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        """
+        Get cached embedding for query (memory, then Redis).
+
+        Returns:
+            Embedding vector or None
+        """
+        return self.lookup_embedding(query)[0]
 
     def set_embedding(
         self,
@@ -228,51 +310,190 @@ class CacheManager:
         Args:
             query: Search query
             embedding: Vector embedding
-            ttl: Time to live (default: 7 days)
+            ttl: Redis time to live (default: 7 days)
         """
+        cache_key = self._generate_cache_key("embedding", query)
+        self._memory_set("embedding", cache_key, embedding)
+
         if not self.redis_enabled:
             return
 
         assert self.redis_client is not None
-        cache_key = self._generate_cache_key("embedding", query)
 
         try:
-            self.redis_client.setex(cache_key, ttl, json.dumps(embedding))
+            # float32 is plenty for cosine similarity and half the bytes of float64
+            payload = np.asarray(embedding, dtype=np.float32).tobytes()
+            self.redis_client.setex(cache_key, ttl, payload)
             self.metrics["sets"] += 1
-            print(f"✓ Cache SET (embedding): {query[:50]}")
+            logger.debug("Cache SET (embedding): %s", query[:50])
 
         except Exception as e:
-            print(f"Embedding cache set error: {e}")
+            logger.warning("Embedding cache set error: %s", e)
 
-    # ==================== Parsed Filters Cache ====================
+    async def aget_embedding(self, query: str) -> Optional[List[float]]:
+        """
+        Async get_embedding for callers on the event loop.
 
-    def get_parsed_filters(self, query: str) -> Optional[Dict]:
+        Returns:
+            Embedding vector or None
+        """
+        cache_key = self._generate_cache_key("embedding", query)
+
+        embedding = self._memory_get("embedding", cache_key)
+        if embedding is not None:
+            self.metrics["hits"]["memory"] += 1
+            return embedding
+
+        if self.redis_enabled and self.aredis is not None:
+            try:
+                cached = await self.aredis.get(cache_key)
+                if cached:
+                    self.metrics["hits"]["redis"] += 1
+                    logger.debug("Cache HIT (embedding): %s", query[:50])
+                    embedding = np.frombuffer(cached, dtype=np.float32).tolist()
+                    self._memory_set("embedding", cache_key, embedding)
+                    return embedding
+
+            except Exception as e:
+                logger.warning("Embedding cache get error: %s", e)
+
+        self.metrics["misses"] += 1
+        return None
+
+    async def aset_embedding(
+        self,
+        query: str,
+        embedding: List[float],
+        ttl: int = 604800,  # 7 days
+    ):
+        """
+        Async set_embedding for callers on the event loop.
+
+        Args:
+            query: Search query
+            embedding: Vector embedding
+            ttl: Redis time to live (default: 7 days)
         """
-        Get cached AI-parsed filters.
+        cache_key = self._generate_cache_key("embedding", query)
+        self._memory_set("embedding", cache_key, embedding)
+
+        if not self.redis_enabled or self.aredis is None:
+            return
+
+        try:
+            payload = np.asarray(embedding, dtype=np.float32).tobytes()
+            await self.aredis.setex(cache_key, ttl, payload)
+            self.metrics["sets"] += 1
+            logger.debug("Cache SET (embedding): %s", query[:50])
+
+        except Exception as e:
+            logger.warning("Embedding cache set error: %s", e)
 
-        This saves expensive GPT-4o-mini calls for repeat queries.
+    def mget_embeddings(self, queries: List[str]) -> Dict[str, Optional[List[float]]]:
+        """
+        Get cached embeddings for many queries in one Redis round-trip.
 
         Returns:
-            Parsed filters dict or None
+            Dict of query -> embedding (None for misses)
         """
-        if not self.redis_enabled:
-            return None
+        if not self.redis_enabled or not queries:
+            return {query: None for query in queries}
 
         assert self.redis_client is not None
-        cache_key = self._generate_cache_key("filters", query)
+        keys = [self._generate_cache_key("embedding", query) for query in queries]
 
         try:
-            cached = self.redis_client.get(cache_key)
+            raw = self.redis_client.mget(keys)
+        except Exception as e:
+            logger.warning("Embedding cache mget error: %s", e)
+            raw = [None] * len(queries)
+
+        results: Dict[str, Optional[List[float]]] = {}
+        for query, cached in zip(queries, raw):
             if cached:
                 self.metrics["hits"]["redis"] += 1
-                print(f"✓ Cache HIT (filters): {query[:50]}")
-                return json.loads(cached)
+                results[query] = np.frombuffer(cached, dtype=np.float32).tolist()
+            else:
+                self.metrics["misses"] += 1
+                results[query] = None
+        return results
+
+    def set_embeddings(
+        self,
+        embeddings: Dict[str, List[float]],
+        ttl: int = 604800,  # 7 days
+    ):
+        """
+        Cache many embeddings in a single pipelined write.
+
+        Args:
+            embeddings: Dict of query -> embedding vector
+            ttl: Time to live (default: 7 days)
+        """
+        if not self.redis_enabled or not embeddings:
+            return
+
+        assert self.redis_client is not None
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for query, embedding in embeddings.items():
+                pipe.setex(
+                    self._generate_cache_key("embedding", query),
+                    ttl,
+                    np.asarray(embedding, dtype=np.float32).tobytes(),
+                )
+            pipe.execute()
+            self.metrics["sets"] += len(embeddings)
+            logger.debug("Cache SET (embedding): %s queries", len(embeddings))
 
         except Exception as e:
-            print(f"Filters cache get error: {e}")
+            logger.warning("Embedding cache set error: %s", e)
+
+    # ==================== Parsed Filters Cache ====================
+
+    def lookup_parsed_filters(self, query: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Get cached AI-parsed filters along with the level that served them.
+
+        This saves expensive GPT-4o-mini calls for repeat queries. Each call
+        returns a fresh dict, so callers may pop fields without touching the
+        cached copy.
+
+        Returns:
+            (filters, "memory" | "redis") or (None, None)
+        """
+        cache_key = self._generate_cache_key("filters", query)
+
+        filters = self._memory_get("filters", cache_key)
+        if filters is not None:
+            self.metrics["hits"]["memory"] += 1
+            return dict(filters), "memory"
+
+        if self.redis_enabled and self.redis_client is not None:
+            try:
+                cached = self.redis_client.get(cache_key)
+                if cached:
+                    self.metrics["hits"]["redis"] += 1
+                    logger.debug("Cache HIT (filters): %s", query[:50])
+                    filters = orjson.loads(cached)
+                    self._memory_set("filters", cache_key, dict(filters))
+                    return filters, "redis"
+
+            except Exception as e:
+                logger.warning("Filters cache get error: %s", e)
 
         self.metrics["misses"] += 1
-        return None
+        return None, None
+
+    def get_parsed_filters(self, query: str) -> Optional[Dict]:
+        """
+        Get cached AI-parsed filters (memory, then Redis).
+
+        Returns:
+            Parsed filters dict or None
+        """
+        return self.lookup_parsed_filters(query)[0]
 
     def set_parsed_filters(
         self,
@@ -286,21 +507,23 @@ class CacheManager:
         Args:
             query: Search query
             filters: Parsed filters from AI
-            ttl: Time to live (default: 24 hours)
+            ttl: Redis time to live (default: 24 hours)
         """
+        cache_key = self._generate_cache_key("filters", query)
+        self._memory_set("filters", cache_key, dict(filters))
+
         if not self.redis_enabled:
             return
 
         assert self.redis_client is not None
-        cache_key = self._generate_cache_key("filters", query)
 
         try:
-            self.redis_client.setex(cache_key, ttl, json.dumps(filters))
+            self.redis_client.setex(cache_key, ttl, _dumps(filters))
             self.metrics["sets"] += 1
-            print(f"✓ Cache SET (filters): {query[:50]}")
+            logger.debug("Cache SET (filters): %s", query[:50])
 
         except Exception as e:
-            print(f"Filters cache set error: {e}")
+            logger.warning("Filters cache set error: %s", e)
 
     # ==================== Batch Operations ====================
 
@@ -330,12 +553,15 @@ class CacheManager:
 
     def clear_all(self):
         """Clear all caches (for testing/debugging)"""
+        with self._memory_lock:
+            for cache in self._memory.values():
+                cache.clear()
         if self.redis_enabled and self.redis_client is not None:
             try:
                 self.redis_client.flushdb()
-                print("✓ All caches cleared")
+                logger.info("All caches cleared")
             except Exception as e:
-                print(f"Cache clear error: {e}")
+                logger.warning("Cache clear error: %s", e)
 
     def clear_search_cache(self):
         """Clear only search result caches"""
@@ -344,9 +570,9 @@ class CacheManager:
                 keys = self.redis_client.keys("search:*")
                 if keys:
                     self.redis_client.delete(*keys)
-                    print(f"✓ Cleared {len(keys)} search cache entries")
+                    logger.info("Cleared %s search cache entries", len(keys))
             except Exception as e:
-                print(f"Cache clear error: {e}")
+                logger.warning("Cache clear error: %s", e)
 
     def get_stats(self) -> Dict:
         """
@@ -377,7 +603,7 @@ class CacheManager:
                 stats["redis_memory_mb"] = round(info["used_memory"] / 1024 / 1024, 2)
                 stats["redis_keys"] = self.redis_client.dbsize()
             except Exception as e:
-                print(f"Error getting Redis stats: {e}")
+                logger.warning("Error getting Redis stats: %s", e)
 
         return stats
 
@@ -387,7 +613,8 @@ class CacheManager:
 
         Args:
             queries: List of common search queries
-            embedding_generator: Function that generates embeddings
+            embedding_generator: Function mapping a list of queries to their
+                embeddings, in the same order
         """
         if not self.redis_enabled:
             logger.debug("Redis not enabled, skipping warmup")
@@ -404,29 +631,28 @@ class CacheManager:
 
         logger.info("Warming up cache with %d common queries...", len(queries))
 
-        cached_count = 0
-        generated_count = 0
-        for query in queries:
-            # Check if already cached (silent check)
-            cache_key = self._generate_cache_key("embedding", query)
-            try:
-                if self.redis_client.exists(cache_key):
-                    cached_count += 1
-                    continue
-            except Exception:
-                pass
+        # One MGET for every query instead of an EXISTS round-trip each
+        cached = self.mget_embeddings(queries)
+        missing = [query for query in queries if cached[query] is None]
+        cached_count = len(queries) - len(missing)
 
-            # Generate and cache embedding
+        # The embeddings endpoint takes a list and returns vectors in input
+        # order, so every miss is embedded in one request
+        generated: Dict[str, List[float]] = {}
+        if missing:
             try:
-                embedding = embedding_generator(query)
-                if embedding:
-                    self.set_embedding(query, embedding, ttl=2592000)  # 30 days
-                    generated_count += 1
-                    time.sleep(0.1)  # Rate limit
+                embeddings = embedding_generator(missing)
+                generated = {
+                    query: embedding
+                    for query, embedding in zip(missing, embeddings)
+                    if embedding
+                }
             except Exception as e:
-                logger.debug("Error caching %s: %s", query, e)
+                logger.debug("Error generating warmup embeddings: %s", e)
+
+        self.set_embeddings(generated, ttl=2592000)  # 30 days
 
-        logger.info("Cache warmup complete: %d cached, %d generated", cached_count, generated_count)
+        logger.info("Cache warmup complete: %d cached, %d generated", cached_count, len(generated))
 
 
 # Common queries to pre-warm (film/tv, emotions, demographics)
@@ -556,11 +782,19 @@ def lru_cached_search(maxsize=100):
 
     def decorator(func):
         @lru_cache(maxsize=maxsize)
-        def wrapper(query: str, filters_tuple):
+        def cached(query: str, filters_tuple):
             # Convert tuple back to dict
             filters = dict(filters_tuple) if filters_tuple else {}
             return func(query, filters)
 
+        @wraps(func)
+        def wrapper(query: str, filters: Optional[Dict] = None):
+            # Callers pass a plain dict; sort it into a hashable key here
+            filters_tuple = tuple(sorted(filters.items())) if filters else ()
+            return cached(query, filters_tuple)
+
+        wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
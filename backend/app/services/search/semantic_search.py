@@ -1,7 +1,6 @@
 """Semantic search for monologues using embeddings."""
 
 import concurrent.futures
-import hashlib
 import json
 import logging
 import random as _random
@@ -18,22 +17,17 @@ from app.services.ai.content_analyzer import ContentAnalyzer
 from app.services.search.cache_manager import cache_manager
 from app.services.search.query_optimizer import QueryOptimizer
 
-# Module-level in-memory caches (Level 0 hot cache shared across SemanticSearch instances).
-# Uses OrderedDict for LRU eviction - popular queries stay cached longer.
-# These are always available, even when Redis is not installed, and keep repeat
-# queries cheap within a single process. Keys use a *canonical* form of the query
-# so trivial variants like "Hamlet", "hamlet ", or "HAMLET!!!" all share entries.
+# Module-level in-memory result cache (Level 0, shared across SemanticSearch
+# instances) used when Redis is not available. Uses OrderedDict for LRU
+# eviction - popular queries stay cached longer. Keys use a *canonical* form of
+# the query so trivial variants like "Hamlet", "hamlet ", or "HAMLET!!!" all
+# share entries. Embeddings and parsed filters get their in-process tier from
+# CacheManager, which checks memory before Redis.
 #
-# Max sizes are tuned for a 512 MB instance (~200 MB baseline from imports):
-#   - Embeddings: 500 × ~6 KB ≈ 3 MB
-#   - Query parse: 1000 × ~5 KB ≈ 5 MB
+# Max size is tuned for a 512 MB instance (~200 MB baseline from imports):
 #   - Search results: 300 × ~20 KB ≈ 6 MB
-_MAX_EMBEDDING_CACHE = 500
-_MAX_QUERY_PARSE_CACHE = 1000
 _MAX_SEARCH_RESULTS_CACHE = 300
 
-EMBEDDING_CACHE: OrderedDict[str, List[float]] = OrderedDict()
-QUERY_PARSE_CACHE: OrderedDict[str, Dict] = OrderedDict()
 SEARCH_RESULTS_CACHE: OrderedDict[str, List[Any]] = OrderedDict()
 
 
@@ -622,51 +616,37 @@ class SemanticSearch:
         # embedding API call concurrently with the AI query parsing call.
         embedding_model = "text-embedding-3-large"
         embedding_dims = 1536  # Max 2000 for pgvector HNSW indexing
-        _emb_cache_suffix = f"_{embedding_model}_{embedding_dims}"
-        _emb_hash = hashlib.md5(
-            (canonical_query + _emb_cache_suffix).encode()
-        ).hexdigest()
-        _precomputed_embedding: Optional[List[float]] = None
+        _emb_cache_query = canonical_query + f"_{embedding_model}_{embedding_dims}"
         _embedding_future: Optional[concurrent.futures.Future] = None
         _emb_start: Optional[float] = None
 
-        if _emb_hash in EMBEDDING_CACHE:
-            _precomputed_embedding = EMBEDDING_CACHE[_emb_hash]
-            EMBEDDING_CACHE.move_to_end(_emb_hash)
-            logger.debug("Embedding pre-check: in-memory cache hit for: %s", query)
-            self._debug_timing["embedding_source"] = "memory_cache"
+        # Memory first, then Redis (CacheManager promotes Redis hits to memory)
+        _precomputed_embedding, _emb_level = self.cache.lookup_embedding(_emb_cache_query)
+        if _precomputed_embedding:
+            logger.debug("Embedding pre-check: %s cache hit for: %s", _emb_level, query)
+            self._debug_timing["embedding_source"] = f"{_emb_level}_cache"
         else:
-            _emb_cache_query = canonical_query + _emb_cache_suffix
-            _cached_emb = self.cache.get_embedding(_emb_cache_query)
-            if _cached_emb:
-                _precomputed_embedding = _cached_emb
-                EMBEDDING_CACHE[_emb_hash] = _precomputed_embedding
-                EMBEDDING_CACHE.move_to_end(_emb_hash)
-                _evict_if_needed(EMBEDDING_CACHE, _MAX_EMBEDDING_CACHE)
-                logger.debug("Embedding pre-check: Redis cache hit for: %s", query)
-                self._debug_timing["embedding_source"] = "redis_cache"
-            else:
-                # No cache hit — start embedding generation in background thread
-                # so it runs in parallel with AI query parsing (Tier 3) or
-                # filter merging + result cache check (Tier 1/2).
-                from app.services.ai.langchain.embeddings import (
-                    generate_embedding as _gen_emb,
-                )
+            # No cache hit — start embedding generation in background thread
+            # so it runs in parallel with AI query parsing (Tier 3) or
+            # filter merging + result cache check (Tier 1/2).
+            from app.services.ai.langchain.embeddings import (
+                generate_embedding as _gen_emb,
+            )
 
-                logger.debug(
-                    "Embedding pre-check: cache miss, starting background generation"
-                )
-                self._debug_timing["embedding_source"] = "generated"
-                _emb_start = time.time()
-                # Use 2 workers to allow parallel embedding + AI parsing
-                _emb_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-                _embedding_future = _emb_executor.submit(
-                    _gen_emb,
-                    text=query,
-                    model=embedding_model,
-                    dimensions=embedding_dims,
-                    api_key=self.analyzer.api_key,
-                )
+            logger.debug(
+                "Embedding pre-check: cache miss, starting background generation"
+            )
+            self._debug_timing["embedding_source"] = "generated"
+            _emb_start = time.time()
+            # Use 2 workers to allow parallel embedding + AI parsing
+            _emb_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+            _embedding_future = _emb_executor.submit(
+                _gen_emb,
+                text=query,
+                model=embedding_model,
+                dimensions=embedding_dims,
+                api_key=self.analyzer.api_key,
+            )
 
         if explicit_filters:
             # If the user provided explicit filters, skip AI parsing entirely to save cost.
@@ -678,45 +658,24 @@ class SemanticSearch:
                     "Tier 1/2 query with no explicit filters - skipping AI query parsing"
                 )
             else:
-                # Tier 3: complex semantic query – use AI parsing with multi-level caching.
-                query_hash = hashlib.md5(canonical_query.encode()).hexdigest()
-
-                # Level 0: in-memory cache (shared across all SemanticSearch instances)
-                if query_hash in QUERY_PARSE_CACHE:
-                    logger.debug("Using in-memory cached query parse for: %s", query)
-                    extracted_filters = QUERY_PARSE_CACHE[query_hash]
-                    self._debug_timing["ai_parse_source"] = "memory_cache"
+                # Tier 3: complex semantic query – use AI parsing with multi-level
+                # caching (CacheManager: memory, then Redis).
+                cached_filters, parse_level = self.cache.lookup_parsed_filters(canonical_query)
+                if cached_filters:
+                    logger.debug("Using %s cached query parse for: %s", parse_level, query)
+                    extracted_filters = cached_filters
+                    self._debug_timing["ai_parse_source"] = f"{parse_level}_cache"
                     self._debug_timing["ai_parse_ms"] = 0
-                    QUERY_PARSE_CACHE.move_to_end(
-                        query_hash
-                    )  # Mark as recently used (LRU)
                 else:
-                    # Level 1: Redis cache via CacheManager
-                    cached_filters = self.cache.get_parsed_filters(canonical_query)
-                    if cached_filters:
-                        logger.debug("Using Redis cached query parse for: %s", query)
-                        extracted_filters = cached_filters
-                        self._debug_timing["ai_parse_source"] = "redis_cache"
-                        self._debug_timing["ai_parse_ms"] = 0
-                        QUERY_PARSE_CACHE[query_hash] = extracted_filters
-                    else:
-                        parse_start = time.time()
-                        logger.debug("Parsing query for filters (AI): %s", query)
-                        extracted_filters = self.analyzer.parse_search_query(query)
-                        parse_time = time.time() - parse_start
-                        logger.debug("Query parsing took %.2fs", parse_time)
-                        self._debug_timing["ai_parse_ms"] = round(parse_time * 1000)
-                        self._debug_timing["ai_parse_source"] = "api"
-                        # Store in both in-memory and Redis caches
-                        QUERY_PARSE_CACHE[query_hash] = extracted_filters
-                        QUERY_PARSE_CACHE.move_to_end(
-                            query_hash
-                        )  # Mark as recently used
-                        self.cache.set_parsed_filters(
-                            canonical_query, extracted_filters
-                        )
-
-                        _evict_if_needed(QUERY_PARSE_CACHE, _MAX_QUERY_PARSE_CACHE)
+                    parse_start = time.time()
+                    logger.debug("Parsing query for filters (AI): %s", query)
+                    extracted_filters = self.analyzer.parse_search_query(query)
+                    parse_time = time.time() - parse_start
+                    logger.debug("Query parsing took %.2fs", parse_time)
+                    self._debug_timing["ai_parse_ms"] = round(parse_time * 1000)
+                    self._debug_timing["ai_parse_source"] = "api"
+                    # Stored in both in-memory and Redis caches
+                    self.cache.set_parsed_filters(canonical_query, extracted_filters)
 
         # Extract AI validation fields before merging
         if extracted_filters:
@@ -907,11 +866,7 @@ class SemanticSearch:
                 self._debug_timing["embedding_ms"] = round(_emb_elapsed * 1000)
             if query_embedding:
                 # Store in in-memory and Redis caches
-                _emb_cache_query_store = canonical_query + _emb_cache_suffix
-                EMBEDDING_CACHE[_emb_hash] = query_embedding
-                EMBEDDING_CACHE.move_to_end(_emb_hash)
-                self.cache.set_embedding(_emb_cache_query_store, query_embedding)
-                _evict_if_needed(EMBEDDING_CACHE, _MAX_EMBEDDING_CACHE)
+                self.cache.set_embedding(_emb_cache_query, query_embedding)
         else:
             # Fallback: generate embedding synchronously (shouldn't normally reach here)
             logger.debug("Generating embedding synchronously (fallback): %s", query)
@@ -929,11 +884,7 @@ class SemanticSearch:
                 time.time() - _emb_start_sync,
             )
             if query_embedding:
-                _emb_cache_query_store = canonical_query + _emb_cache_suffix
-                EMBEDDING_CACHE[_emb_hash] = query_embedding
-                EMBEDDING_CACHE.move_to_end(_emb_hash)
-                self.cache.set_embedding(_emb_cache_query_store, query_embedding)
-                _evict_if_needed(EMBEDDING_CACHE, _MAX_EMBEDDING_CACHE)
+                self.cache.set_embedding(_emb_cache_query, query_embedding)
 
         if not query_embedding:
             logger.info("Failed to generate embedding, falling back to text search")
@@ -106,11 +106,11 @@ def warmup_embeddings():
     skipped = 0
     start_time = time.time()
 
-    for i, query in enumerate(COMMON_QUERIES, 1):
-        # Check if already cached
-        cached = cache_manager.get_embedding(query)
+    # Check every query against the cache in a single round-trip
+    cached_embeddings = cache_manager.mget_embeddings(COMMON_QUERIES)
 
-        if cached:
+    for i, query in enumerate(COMMON_QUERIES, 1):
+        if cached_embeddings[query]:
             skipped += 1
             print(f"[{i}/{len(COMMON_QUERIES)}] ✓ Already cached: {query}")
             continue
@@ -164,8 +164,7 @@ def verify_cache():
     test_queries = COMMON_QUERIES[:10]
     accessible = 0
 
-    for query in test_queries:
-        embedding = cache_manager.get_embedding(query)
+    for query, embedding in cache_manager.mget_embeddings(test_queries).items():
         if embedding:
             accessible += 1
             print(f"  ✓ {query}: {len(embedding)} dimensions")
@@ -45,7 +45,7 @@ from app.services.data_ingestion.wikisource_scraper import WikisourceScraper
 from app.services.data_ingestion.perseus_scraper import PerseusScraper
 from app.services.data_ingestion.deduplicator import MonologueDeduplicator
 from app.services.extraction.plain_text_parser import PlainTextParser
-from app.services.extraction.tei_xml_parser import TEIXMLParser
+from app.services.extraction.tei_parser import TEIParser
 from app.models.actor import Play, Monologue
 
 # Configure logging
@@ -339,7 +339,7 @@ def scrape_perseus(db, limit: int = 50) -> dict:
 
     scraper = PerseusScraper()
     dedup = MonologueDeduplicator(db)
-    tei_parser = TEIXMLParser()
+    tei_parser = TEIParser()
 
     stats = {
         'searched': 0,
@@ -381,8 +381,15 @@ def scrape_perseus(db, limit: int = 50) -> dict:
                     stats['failed'] += 1
                     continue
 
+                # Parse once; metadata and monologue extraction share the root
+                tei_root = tei_parser.parse(xml_content)
+                if tei_root is None:
+                    logger.warning(f"  ✗ Could not parse TEI XML: {file_path}")
+                    stats['failed'] += 1
+                    continue
+
                 # Extract metadata from TEI header
-                metadata = tei_parser.extract_play_metadata(xml_content)
+                metadata = tei_parser.extract_play_metadata(tei_root)
                 title = metadata.get('title', 'Unknown')
                 author = metadata.get('author', 'Unknown')
                 year = metadata.get('year')
@@ -417,7 +424,7 @@ def scrape_perseus(db, limit: int = 50) -> dict:
 
                 # Extract monologues using TEI parser
                 logger.info(f"  🔍 Extracting monologues from TEI XML...")
-                monologues = tei_parser.extract_monologues(xml_content, min_words=50, max_words=500)
+                monologues = tei_parser.extract_monologues(tei_root, min_words=50, max_words=500)
 
                 logger.info(f"  📝 Found {len(monologues)} potential monologues")
 
@@ -465,7 +472,7 @@ def scrape_perseus(db, limit: int = 50) -> dict:
         logger.info("📋 Next Step: Clone Perseus GitHub repos for full text extraction:")
         logger.info("   git clone https://github.com/PerseusDL/canonical-greekLit.git")
         logger.info("   git clone https://github.com/PerseusDL/canonical-latinLit.git")
-        logger.info("   Then parse TEI XML files using TEIXMLParser")
+        logger.info("   Then parse TEI XML files using TEIParser")
 
     return stats
 
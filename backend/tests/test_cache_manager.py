@@ -0,0 +1,245 @@
+"""Tests for CacheManager's Redis-backed caches.
+
+Uses an in-memory stand-in for the Redis client so the get/set paths run
+without a server.
+"""
+
+import asyncio
+import os
+import unittest
+from types import ModuleType, SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from app.services.search.cache_manager import (
+    MEMORY_TTL,
+    REDIS_MAX_CONNECTIONS,
+    CacheManager,
+    lru_cached_search,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value if isinstance(value, bytes) else value.encode()
+        self.ttls[key] = ttl
+
+    def mget(self, keys):
+        self.mget_calls = getattr(self, "mget_calls", 0) + 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def dbsize(self):
+        return len(self.store)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append((key, ttl, value))
+
+    def execute(self):
+        for op in self.ops:
+            self.redis.setex(*op)
+        self.redis.pipeline_executes = getattr(self.redis, "pipeline_executes", 0) + 1
+
+
+class FakeAsyncRedis:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def get(self, key):
+        return self.redis.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.redis.setex(key, ttl, value)
+
+
+def _manager():
+    with mock.patch.dict("sys.modules", {"redis": None}):
+        manager = CacheManager()  # no redis package: memory-only
+    manager.redis_client = FakeRedis()
+    manager.aredis = FakeAsyncRedis(manager.redis_client)
+    manager.redis_enabled = True
+    return manager
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_key_normalizes_query_and_filter_order(self):
+        manager = _manager()
+        a = manager._generate_cache_key("search", " Sad Monologue ", {"gender": "female", "age": "20s"})
+        b = manager._generate_cache_key("search", "sad monologue", {"age": "20s", "gender": "female"})
+        self.assertEqual(a, b)
+        self.assertRegex(a, r"^search:[0-9a-f]{32}$")
+
+    def test_key_separates_fields(self):
+        manager = _manager()
+        self.assertNotEqual(
+            manager._generate_cache_key("search", "q", {"ab": "c"}),
+            manager._generate_cache_key("search", "q", {"a": "bc"}),
+        )
+        self.assertNotEqual(
+            manager._generate_cache_key("search", "q"),
+            manager._generate_cache_key("embedding", "q"),
+        )
+
+
+class SerializationTests(unittest.TestCase):
+    def test_embedding_is_stored_as_float32_bytes(self):
+        manager = _manager()
+        embedding = [0.1 * i for i in range(1536)]
+        manager.set_embedding("sad monologue", embedding)
+
+        [payload] = manager.redis_client.store.values()
+        self.assertEqual(len(payload), 1536 * 4)
+        cached = manager.get_embedding("sad monologue")
+        np.testing.assert_allclose(cached, embedding, rtol=1e-6)
+
+    def test_search_results_accept_numpy_scores(self):
+        manager = _manager()
+        payload = {"rows": [[5, np.float64(0.9), ""]], "best_cosine": np.float32(0.5)}
+        manager.set_search_results("sad", {"gender": "female"}, payload)
+
+        self.assertEqual(
+            manager.get_search_results("sad", {"gender": "female"}),
+            {"rows": [[5, 0.9, ""]], "best_cosine": 0.5},
+        )
+
+
+class BatchEmbeddingTests(unittest.TestCase):
+    def test_mget_returns_hits_and_misses_in_one_call(self):
+        manager = _manager()
+        manager.set_embedding("sad", [1.0, 2.0])
+
+        result = manager.mget_embeddings(["sad", "happy"])
+
+        self.assertEqual(result, {"sad": [1.0, 2.0], "happy": None})
+        self.assertEqual(manager.redis_client.mget_calls, 1)
+
+    def test_warmup_embeds_only_misses_in_one_call_and_writes_once(self):
+        manager = _manager()
+        manager.set_embedding("sad", [1.0])
+        calls = []
+
+        def generator(queries):
+            calls.append(queries)
+            return [[2.0], []]
+
+        manager.warmup_common_queries(["sad", "happy", "angry"], generator)
+
+        self.assertEqual(calls, [["happy", "angry"]])
+        self.assertEqual(manager.redis_client.pipeline_executes, 1)
+        self.assertEqual(manager.get_embedding("happy"), [2.0])
+        self.assertIsNone(manager.get_embedding("angry"))
+
+
+class MemoryTierTests(unittest.TestCase):
+    def test_redis_hit_is_promoted_to_memory(self):
+        manager = _manager()
+        manager.set_embedding("sad", [0.5])
+        manager._memory["embedding"].clear()
+
+        self.assertEqual(manager.lookup_embedding("sad"), ([0.5], "redis"))
+        manager.redis_client.store.clear()
+        self.assertEqual(manager.lookup_embedding("sad"), ([0.5], "memory"))
+        self.assertEqual(manager.metrics["hits"]["memory"], 1)
+
+    def test_memory_works_without_redis(self):
+        manager = _manager()
+        manager.redis_enabled = False
+        manager.set_parsed_filters("sad woman", {"gender": "female", "is_valid_search": True})
+
+        filters, level = manager.lookup_parsed_filters("sad woman")
+        self.assertEqual(level, "memory")
+        filters.pop("is_valid_search")
+        self.assertIn("is_valid_search", manager.get_parsed_filters("sad woman"))
+
+    def test_entries_expire_and_lru_evicts(self):
+        manager = _manager()
+        manager.redis_enabled = False
+        clock = "app.services.search.cache_manager.time.monotonic"
+        with mock.patch(clock, return_value=0):
+            manager.set_embedding("old", [1.0])
+        with mock.patch(clock, return_value=MEMORY_TTL - 1):
+            self.assertEqual(manager.get_embedding("old"), [1.0])
+        with mock.patch(clock, return_value=2 * MEMORY_TTL):
+            self.assertIsNone(manager.get_embedding("old"))
+
+        with mock.patch.dict("app.services.search.cache_manager.MEMORY_MAX_ENTRIES", {"embedding": 2}):
+            for query in ("a", "b", "c"):
+                manager.set_embedding(query, [1.0])
+        self.assertEqual(len(manager._memory["embedding"]), 2)
+        self.assertIsNone(manager.get_embedding("a"))
+
+
+class AsyncEmbeddingTests(unittest.TestCase):
+    def test_async_roundtrip_shares_keys_with_sync_client(self):
+        manager = _manager()
+        asyncio.run(manager.aset_embedding("sad", [0.5, 0.25]))
+
+        self.assertEqual(manager.get_embedding("sad"), [0.5, 0.25])
+        self.assertEqual(asyncio.run(manager.aget_embedding("sad")), [0.5, 0.25])
+        self.assertIsNone(asyncio.run(manager.aget_embedding("happy")))
+
+
+class ConnectionLimitTests(unittest.TestCase):
+    def test_sync_and_async_pools_share_the_process_limit(self):
+        pools = []
+        fake_redis = ModuleType("redis")
+        fake_redis.ConnectionPool = SimpleNamespace(
+            from_url=lambda url, **kwargs: pools.append(kwargs["max_connections"])
+        )
+        fake_redis.Redis = lambda connection_pool: mock.MagicMock()
+        fake_aioredis = ModuleType("redis.asyncio")
+        fake_aioredis.Redis = SimpleNamespace(
+            from_url=lambda url, **kwargs: pools.append(kwargs["max_connections"])
+        )
+        fake_redis.asyncio = fake_aioredis
+
+        with mock.patch.dict("sys.modules", {"redis": fake_redis, "redis.asyncio": fake_aioredis}), \
+                mock.patch.dict(os.environ, {"REDIS_URL": "redis://localhost:6379"}):
+            manager = CacheManager()
+
+        self.assertTrue(manager.redis_enabled)
+        self.assertEqual(len(pools), 2)
+        self.assertLessEqual(sum(pools), REDIS_MAX_CONNECTIONS)
+
+
+class LruCachedSearchTests(unittest.TestCase):
+    def test_dict_filters_are_cached_regardless_of_order(self):
+        calls = []
+
+        @lru_cached_search(maxsize=8)
+        def search(query, filters):
+            calls.append((query, filters))
+            return [query, sorted(filters)]
+
+        first = search("sad", {"gender": "female", "age": "20s"})
+        second = search("sad", {"age": "20s", "gender": "female"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(calls, [("sad", {"age": "20s", "gender": "female"})])
+        self.assertEqual(search.cache_info().hits, 1)
+        self.assertEqual(search.__name__, "search")
+
+        search.cache_clear()
+        search("sad")
+        self.assertEqual(calls[-1], ("sad", {}))
+        self.assertEqual(search.cache_info().hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the background email outbox.
+
+Signup and webhook emails are queued instead of sent on the request thread.
+A failing send must be retried and, once retries are exhausted, land in the
+dead-letter list rather than disappearing silently.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from app.services.email import notifications, outbox
+
+
+class OutboxTests(unittest.TestCase):
+    def setUp(self):
+        outbox.dead_letters.clear()
+
+    def test_enqueued_send_runs_in_background(self):
+        done = threading.Event()
+        seen = {}
+
+        def send(user_email, user_name=None):
+            seen["args"] = (user_email, user_name)
+            done.set()
+
+        outbox.enqueue(send, user_email="a@b.com", user_name="Ada")
+        self.assertTrue(done.wait(2))
+        self.assertEqual(seen["args"], ("a@b.com", "Ada"))
+
+    def test_failing_send_retries_then_dead_letters(self):
+        calls = []
+
+        def send(**kwargs):
+            calls.append(kwargs)
+            raise RuntimeError("resend down")
+
+        with mock.patch.object(outbox, "BACKOFF_BASE_SECONDS", 0.0), \
+                mock.patch.object(outbox, "MAX_RETRIES", 2):
+            outbox.enqueue(send, user_email="a@b.com")
+            for _ in range(200):
+                if outbox.dead_letters:
+                    break
+                threading.Event().wait(0.01)
+
+        self.assertEqual(len(calls), 3)  # first attempt + 2 retries
+        self.assertEqual(len(outbox.dead_letters), 1)
+        self.assertEqual(outbox.dead_letters[0]["error"], "resend down")
+        self.assertEqual(outbox.dead_letters[0]["kwargs"], {"user_email": "a@b.com"})
+
+    def test_failed_status_return_is_retried(self):
+        done = threading.Event()
+        results = [{"id": "error", "status": "failed"}, {"id": "email-1"}]
+        calls = []
+
+        def send(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == len(results):
+                done.set()
+            return results[len(calls) - 1]
+
+        with mock.patch.object(outbox, "BACKOFF_BASE_SECONDS", 0.0):
+            outbox.enqueue(send, user_email="a@b.com")
+            self.assertTrue(done.wait(2))
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(list(outbox.dead_letters), [])
+
+    def test_upgrade_notification_raises_so_the_outbox_retries(self):
+        with mock.patch.object(notifications, "_RESEND_ENABLED", True), \
+                mock.patch.object(notifications, "ResendEmailClient") as client:
+            client.return_value.send_email.side_effect = RuntimeError("resend down")
+            with self.assertRaises(RuntimeError):
+                notifications.send_upgrade_notification(
+                    user_name="Ada",
+                    user_email="a@b.com",
+                    tier_display_name="Plus",
+                    billing_period="monthly",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the content-hash extraction cache shared by the upload endpoints.
+
+Every path that runs ScriptParser.parse_script goes through the same
+ExtractionCache table, so /dev/clear-extraction-cache clears all of them.
+Entries are keyed by extraction mode as well as content hash: a quick parse
+must never answer a full-mode lookup.
+"""
+
+import unittest
+from unittest import mock
+
+from app.api import scripts
+from app.models.actor import ExtractionCache
+
+RESULT = {
+    "raw_text": "HAMLET\nTo be, or not to be.",
+    "metadata": {"title": "Hamlet"},
+    "scenes": [{"title": "Nunnery", "lines": []}],
+}
+
+
+class FakeTable:
+    """ExtractionCache rows by key, behind the query/filter/first and add/commit calls."""
+
+    def __init__(self):
+        self.rows = {}
+        self._key = None
+
+    def query(self, model):
+        return self
+
+    def filter(self, condition):
+        self._key = condition.right.value
+        return self
+
+    def first(self):
+        return self.rows.get(self._key)
+
+    def add(self, entry):
+        self.rows[entry.file_hash] = entry
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CachedExtractionTests(unittest.TestCase):
+    def test_hit_returns_stored_result(self):
+        db = mock.MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = ExtractionCache(
+            file_hash="abc", extraction_result=RESULT
+        )
+        self.assertEqual(scripts._cached_extraction(db, "abc", "full"), RESULT)
+        db.query.assert_called_once_with(ExtractionCache)
+
+    def test_miss_and_db_errors_return_none(self):
+        db = mock.MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = None
+        self.assertIsNone(scripts._cached_extraction(db, "abc", "full"))
+
+        db.query.side_effect = RuntimeError("connection reset")
+        self.assertIsNone(scripts._cached_extraction(db, "abc", "full"))
+
+    def test_quick_result_does_not_answer_a_full_lookup(self):
+        table = FakeTable()
+        with mock.patch.object(scripts, "SessionLocal", return_value=table):
+            scripts._store_extraction("abc", "quick", RESULT)
+
+        self.assertIsNone(scripts._cached_extraction(table, "abc", "full"))
+        self.assertEqual(scripts._cached_extraction(table, "abc", "quick"), RESULT)
+
+
+class StoreExtractionTests(unittest.TestCase):
+    def test_result_is_written_with_its_hash(self):
+        session = mock.MagicMock()
+        with mock.patch.object(scripts, "SessionLocal", return_value=session):
+            scripts._store_extraction("abc", "full", RESULT)
+
+        entry = session.add.call_args.args[0]
+        self.assertIsInstance(entry, ExtractionCache)
+        self.assertEqual(entry.file_hash, "full:abc")
+        self.assertEqual(entry.extraction_result, RESULT)
+        session.commit.assert_called_once()
+        session.close.assert_called_once()
+
+    def test_write_failures_are_swallowed(self):
+        session = mock.MagicMock()
+        session.commit.side_effect = RuntimeError("duplicate key")
+        with mock.patch.object(scripts, "SessionLocal", return_value=session):
+            scripts._store_extraction("abc", "full", RESULT)  # must not raise
+
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""KeywordExtractor caching and word matching.
+
+extract() is cached on the normalized query, so case and spacing variants
+must share an entry and still produce the same filters, and the shared
+result must be read-only.
+"""
+
+import unittest
+
+from app.services.search.query_optimizer import KeywordExtractor
+
+
+class ExtractCacheTests(unittest.TestCase):
+    def test_case_and_spacing_variants_share_a_cache_entry(self):
+        first = KeywordExtractor.extract("sad woman")
+        self.assertIs(KeywordExtractor.extract("  Sad   WOMAN "), first)
+        self.assertEqual(first["gender"], "female")
+        self.assertEqual(first["emotion"], "sadness")
+
+    def test_cached_result_cannot_be_mutated(self):
+        filters = KeywordExtractor.extract("angry man")
+        with self.assertRaises(TypeError):
+            filters["gender"] = "female"
+        self.assertEqual(KeywordExtractor.extract("angry man")["gender"], "male")
+
+    def test_blank_query_extracts_nothing(self):
+        self.assertEqual(KeywordExtractor.extract(""), {})
+        self.assertEqual(KeywordExtractor.extract(" \t "), {})
+
+
+class PhraseTests(unittest.TestCase):
+    def test_multi_word_keys_match(self):
+        self.assertEqual(KeywordExtractor.extract("young adult woman")["age_range"], "20s")
+        self.assertEqual(KeywordExtractor.extract("middle aged man")["age_range"], "40s")
+        self.assertEqual(KeywordExtractor.extract("bad guy monologue")["themes"], ["power", "revenge"])
+
+    def test_single_word_still_matches_outside_the_phrase(self):
+        self.assertEqual(KeywordExtractor.extract("young woman")["age_range"], "teens")
+
+
+class ActSceneTests(unittest.TestCase):
+    def test_numbers_and_roman_numerals(self):
+        filters = KeywordExtractor.extract("Hamlet act III scene 2")
+        self.assertEqual((filters["act"], filters["scene"]), (3, 2))
+        self.assertEqual(KeywordExtractor.extract("scene xxiv")["scene"], 24)
+
+    def test_first_mention_wins(self):
+        filters = KeywordExtractor.extract("scene iv of act 2, not act 5 scene 1")
+        self.assertEqual((filters["act"], filters["scene"]), (2, 4))
+
+
+class ConfidenceTests(unittest.TestCase):
+    def test_word_count_from_extract_matches_query(self):
+        for q in ("sad woman", "  a  grieving mother  who lost her son ", ""):
+            filters, word_count = KeywordExtractor.extract_with_meta(q)
+            self.assertEqual(word_count, len(q.split()), q)
+            self.assertEqual(
+                KeywordExtractor.get_extraction_confidence(word_count, filters),
+                KeywordExtractor.get_extraction_confidence(q, filters),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for bulk marketing sends through ResendEmailClient.send_many.
+
+Campaigns go out as one pooled burst. Requests are served by an
+httpx.MockTransport, so nothing leaves the process; a failed recipient must
+be reported without stopping the rest of the campaign.
+"""
+
+import asyncio
+import json
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+
+from app.services.email import marketing, resend_client
+from app.services.email.resend_client import ResendEmailClient
+
+
+def _mock_resend(handler):
+    """Patch send_many's AsyncClient to serve requests from handler."""
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return mock.patch.object(resend_client.httpx, "AsyncClient", side_effect=client)
+
+
+class SendManyTests(unittest.TestCase):
+    def test_results_keep_message_order_and_failures(self):
+        def handler(request):
+            to = json.loads(request.content)["to"]
+            if to == "bad@example.com":
+                return httpx.Response(422, json={"message": "invalid"})
+            return httpx.Response(200, json={"id": f"id-{to}"})
+
+        client = ResendEmailClient(api_key="re_test")
+        with _mock_resend(handler):
+            results = asyncio.run(client.send_many([
+                {"to": "a@example.com", "subject": "Hi", "html": "<p>a</p>"},
+                {"to": "bad@example.com", "subject": "Hi", "html": "<p>b</p>"},
+                {"to": "c@example.com", "subject": "Hi", "plain_text": "c"},
+            ]))
+
+        self.assertEqual(results[0], {"id": "id-a@example.com"})
+        self.assertIsInstance(results[1], httpx.HTTPStatusError)
+        self.assertEqual(results[2], {"id": "id-c@example.com"})
+
+    def test_rate_limited_send_is_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"retry-after": "0"})
+            return httpx.Response(200, json={"id": "ok"})
+
+        client = ResendEmailClient(api_key="re_test")
+        with _mock_resend(handler):
+            results = asyncio.run(client.send_many([{"to": "a@example.com", "subject": "Hi", "html": ""}]))
+
+        self.assertEqual(results, [{"id": "ok"}])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0].headers["authorization"], "Bearer re_test")
+
+
+class SendCampaignTests(unittest.TestCase):
+    def test_campaign_goes_out_through_send_many(self):
+        users = [
+            SimpleNamespace(name="Ada", email="ada@example.com"),
+            SimpleNamespace(name=None, email="bad@example.com"),
+        ]
+        sent = []
+
+        def handler(request):
+            payload = json.loads(request.content)
+            sent.append(payload)
+            if payload["to"] == "bad@example.com":
+                return httpx.Response(422, json={"message": "invalid"})
+            return httpx.Response(200, json={"id": "email-1"})
+
+        with mock.patch.dict(os.environ, {"RESEND_API_KEY": "re_test"}), \
+                mock.patch.object(marketing, "_get_marketing_recipients", return_value=users), \
+                mock.patch.object(ResendEmailClient, "send_email") as send_email, \
+                _mock_resend(handler):
+            result = marketing.send_campaign(mock.MagicMock(), "founder_offer")
+
+        send_email.assert_not_called()
+        self.assertEqual(sorted(p["to"] for p in sent), ["ada@example.com", "bad@example.com"])
+        self.assertTrue(all(p["subject"] == "your 2 weeks of Plus, free" for p in sent))
+        self.assertEqual(result["sent"], 1)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertTrue(result["errors"][0].startswith("bad@example.com: "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Tests for PDF page extraction and PDFParser's line streaming."""
+
+import unittest
+from unittest import mock
+
+from app.services.extraction import pdf_parser
+from app.services.extraction.pdf_parser import PDFParser, iter_pdf_pages
+
+LINE = " ".join(["word"] * 30)
+
+
+class PDFParserTests(unittest.TestCase):
+    def test_speech_spanning_a_page_break_stays_whole(self):
+        pages = [f"HAMLET:\n{LINE}\n{LINE}\n", f"{LINE}\n{LINE}\n\nHORATIO:\nMy lord.\n"]
+        parser = PDFParser()
+        with mock.patch.object(PDFParser, "_iter_pages", return_value=iter(pages)):
+            monologues = parser.extract_monologues("play.pdf")
+
+        self.assertEqual([m["character"] for m in monologues], ["Hamlet"])
+        self.assertEqual(monologues[0]["word_count"], 120)
+
+
+class IterPdfPagesTests(unittest.TestCase):
+    def test_uploads_are_extracted_without_worker_processes(self):
+        import pymupdf
+
+        doc = pymupdf.open()
+        for i in range(pdf_parser.PARALLEL_MIN_PAGES + 1):
+            doc.new_page().insert_text((72, 72), f"PAGE {i}")
+        content = doc.tobytes()
+
+        with mock.patch.object(pdf_parser, "ProcessPoolExecutor") as pool:
+            pages = list(iter_pdf_pages(content))
+
+        pool.assert_not_called()
+        self.assertEqual(len(pages), pdf_parser.PARALLEL_MIN_PAGES + 1)
+        self.assertEqual(pages[3].strip(), "PAGE 3")
+
+
+if __name__ == "__main__":
+    unittest.main()
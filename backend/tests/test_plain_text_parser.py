@@ -0,0 +1,56 @@
+"""Tests for the line-oriented PlainTextParser speech splitter.
+
+Both header styles ("NAME:" on its own line, "NAME. text") go through one
+rule; a speech runs until the next speaker or a blank line.
+"""
+
+import unittest
+
+from app.services.extraction.plain_text_parser import PlainTextParser
+
+LINE = " ".join(["word"] * 30)
+
+
+class SplitSpeechesTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = PlainTextParser()
+
+    def test_colon_header_captures_every_line(self):
+        text = f"HAMLET:\n  {LINE}\n  {LINE}\n"
+        self.assertEqual(
+            self.parser._split_speeches(text),
+            [("HAMLET", f"{LINE}\n  {LINE}")],
+        )
+
+    def test_period_header_keeps_same_line_text(self):
+        text = f"OPHELIA. {LINE}\n{LINE}\nMR. POLONIUS. Hold.\n"
+        speeches = self.parser._split_speeches(text)
+        self.assertEqual([c for c, _ in speeches], ["OPHELIA", "MR. POLONIUS"])
+        self.assertEqual(speeches[1][1], "Hold.")
+
+    def test_blank_line_ends_speech(self):
+        text = f"HAMLET:\n{LINE}\n\nnarration that belongs to no one\n"
+        self.assertEqual(self.parser._split_speeches(text), [("HAMLET", LINE)])
+
+    def test_blank_line_after_bare_header_is_skipped(self):
+        text = f"HAMLET:\n\n{LINE}\n"
+        self.assertEqual(self.parser._split_speeches(text), [("HAMLET", LINE)])
+
+    def test_extract_monologues_filters_by_word_count(self):
+        text = f"HAMLET:\n{LINE}\n{LINE}\n\nHORATIO:\nMy lord.\n"
+        monologues = self.parser.extract_monologues(text, min_words=50, max_words=500)
+        self.assertEqual(len(monologues), 1)
+        self.assertEqual(monologues[0]["character"], "Hamlet")
+        self.assertEqual(monologues[0]["word_count"], 60)
+
+    def test_extract_from_lines_accepts_a_generator(self):
+        text = f"HAMLET:\n{LINE}\n{LINE}\n\nHORATIO:\nMy lord.\n"
+        lines = (line for line in text.splitlines())
+        self.assertEqual(
+            self.parser.extract_monologues_from_lines(lines),
+            self.parser.extract_monologues(text),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
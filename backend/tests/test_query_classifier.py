@@ -0,0 +1,43 @@
+"""Query tier classification.
+
+classify() decides whether a query skips AI parsing entirely (tier 1), uses
+keyword extraction plus an embedding (tier 2) or needs full AI parsing
+(tier 3), so a misclassified query either costs money or loses filters.
+"""
+
+import unittest
+
+from app.services.search.query_optimizer import QueryClassifier
+
+
+class ClassifyTests(unittest.TestCase):
+    def test_single_keywords_are_tier_1(self):
+        for q in ("sad", "Shakespeare", " tv ", "middle-aged"):
+            self.assertEqual(QueryClassifier.classify(q), 1, q)
+        self.assertEqual(QueryClassifier.classify("courtroom"), 3)
+
+    def test_templated_queries_are_tier_2(self):
+        for q in (
+            "sad female",
+            "Funny monologue for woman",
+            "middle aged man",
+            "tv monologues",
+            "dramatic film piece",
+            "monologues for women under 30",
+            "pieces for middle-aged women",
+            "smart ass monologues for men under 29",
+        ):
+            self.assertEqual(QueryClassifier.classify(q), 2, q)
+
+    def test_near_misses_fall_through_to_tier_3(self):
+        for q in (
+            "sad  female",
+            "sad female lawyer",
+            "monologues for women under thirty",
+            "a grieving mother confronts the man who killed her son",
+        ):
+            self.assertEqual(QueryClassifier.classify(q), 3, q)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""QueryOptimizer.optimize caching.
+
+Tier and extracted filters are cached per query, independent of the
+explicit filters, so the merged result must be a fresh dict every call.
+"""
+
+import unittest
+
+from app.services.search.query_optimizer import QueryOptimizer, _optimize_cached
+
+
+class OptimizeTests(unittest.TestCase):
+    def test_explicit_filters_take_precedence_and_may_be_unhashable(self):
+        tier, filters = QueryOptimizer().optimize("sad female", {"gender": "male", "themes": ["love"]})
+        self.assertEqual(tier, 2)
+        self.assertEqual(filters, {"gender": "male", "emotion": "sadness", "themes": ["love"]})
+
+    def test_result_can_be_mutated_without_affecting_the_cache(self):
+        optimizer = QueryOptimizer()
+        _, filters = optimizer.optimize("sad female")
+        filters["gender"] = "male"
+        self.assertEqual(optimizer.optimize("sad female")[1]["gender"], "female")
+        self.assertEqual(optimizer.optimize("sad female", {"act": 1})[1]["act"], 1)
+        self.assertNotIn("act", optimizer.optimize("sad female")[1])
+
+    def test_case_variants_share_a_cache_entry(self):
+        optimizer = QueryOptimizer()
+        optimizer.optimize("funny piece for woman")
+        hits = _optimize_cached.cache_info().hits
+        self.assertEqual(optimizer.optimize(" Funny PIECE for Woman", {"act": 1})[0], 2)
+        self.assertEqual(_optimize_cached.cache_info().hits, hits + 1)
+
+    def test_tier_3_extracts_nothing(self):
+        self.assertEqual(
+            QueryOptimizer().optimize("a grieving mother confronts the man who killed her son"),
+            (3, {}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Batch API ingestion for back-catalog scripts.
+
+submit_batch must send the same combined request extract_combined uses, one
+JSONL row per BATCH_MAX_CHARS window keyed by "{custom_id}:{index}";
+collect_batch must merge replies back per custom_id and fall back to the
+default for unusable or failed rows.
+"""
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.services.script_parser import BATCH_MAX_CHARS, ScriptParser, _batch_windows, _default_combined
+
+SCRIPT = "HAMLET\nTo be, or not to be.\n" * 20
+
+SCENE = {
+    "title": "Nunnery",
+    "character_1": "HAMLET",
+    "character_2": "OPHELIA",
+    "lines": [{"character": "HAMLET", "text": "Get thee to a nunnery."}],
+}
+
+
+def _reply(custom_id, content):
+    body = {"choices": [{"message": {"content": content}}]}
+    return json.dumps({"custom_id": custom_id, "response": {"status_code": 200, "body": body}})
+
+
+class BatchTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = ScriptParser.__new__(ScriptParser)
+        self.parser.client = mock.MagicMock()
+
+    def test_submit_writes_one_combined_request_per_script(self):
+        self.parser.client.files.create.return_value = SimpleNamespace(id="file-1")
+        self.parser.client.batches.create.return_value = SimpleNamespace(id="batch-1")
+
+        batch_id = self.parser.submit_batch([("a", SCRIPT.encode(), "txt"), ("b", SCRIPT.encode(), "txt")])
+
+        self.assertEqual(batch_id, "batch-1")
+        _, payload = self.parser.client.files.create.call_args.kwargs["file"]
+        rows = [json.loads(line) for line in payload.decode().splitlines()]
+        self.assertEqual([r["custom_id"] for r in rows], ["a:0", "b:0"])
+        self.assertEqual(rows[0]["url"], "/v1/chat/completions")
+        self.assertEqual(rows[0]["body"], self.parser._combined_request(SCRIPT, max_chars=40000))
+        self.assertEqual(self.parser.client.batches.create.call_args.kwargs["completion_window"], "24h")
+
+    def test_collect_returns_none_while_running(self):
+        self.parser.client.batches.retrieve.return_value = SimpleNamespace(status="in_progress")
+        self.assertIsNone(self.parser.collect_batch("batch-1"))
+
+    def test_collect_maps_replies_and_defaults_bad_rows(self):
+        self.parser.client.batches.retrieve.return_value = SimpleNamespace(
+            status="completed", output_file_id="out", error_file_id="err"
+        )
+        files = {
+            "out": "\n".join([
+                _reply("good:0", json.dumps({"metadata": {"title": "Hamlet"}, "scenes": [SCENE, {"title": "x"}]})),
+                _reply("garbled:0", "not json"),
+            ]),
+            "err": json.dumps({"custom_id": "failed:0", "error": {"message": "boom"}}),
+        }
+        self.parser.client.files.content.side_effect = lambda file_id: SimpleNamespace(text=files[file_id])
+
+        results = self.parser.collect_batch("batch-1")
+
+        self.assertEqual(results["good"]["metadata"]["title"], "Hamlet")
+        self.assertEqual(results["good"]["scenes"], [SCENE])
+        self.assertEqual(results["garbled"], _default_combined())
+        self.assertEqual(results["failed"], _default_combined())
+
+    def test_long_script_is_split_into_rows_without_truncation(self):
+        self.parser.client.files.create.return_value = SimpleNamespace(id="file-1")
+        self.parser.client.batches.create.return_value = SimpleNamespace(id="batch-1")
+        scene = "HAMLET\nTo be, or not to be.\nOPHELIA\nGood my lord.\n" * 600
+        script = "".join(f"ACT {act}\nSCENE I\n{scene}\n" for act in ("I", "II", "III"))
+        self.assertGreater(len(script), 2 * BATCH_MAX_CHARS)
+
+        self.parser.submit_batch([("long", script.encode(), "txt")])
+
+        _, payload = self.parser.client.files.create.call_args.kwargs["file"]
+        rows = [json.loads(line) for line in payload.decode().splitlines()]
+        self.assertEqual([r["custom_id"] for r in rows], ["long:0", "long:1", "long:2"])
+        windows = _batch_windows(script)
+        self.assertTrue(all(len(w) <= BATCH_MAX_CHARS for w in windows))
+        sent = [line for w in windows for line in w.splitlines() if line]
+        self.assertEqual(sent, [line for line in script.splitlines() if line])
+        for window, row in zip(windows, rows):
+            self.assertEqual(row["body"], self.parser._combined_request(window, max_chars=BATCH_MAX_CHARS))
+
+    def test_collect_merges_split_rows_in_order(self):
+        self.parser.client.batches.retrieve.return_value = SimpleNamespace(
+            status="completed", output_file_id="out", error_file_id=None
+        )
+        later = dict(SCENE, title="Mousetrap")
+        output = "\n".join([
+            _reply("long:1", json.dumps({
+                "metadata": {"title": "Untitled Script", "characters": [{"name": "Claudius"}, {"name": "HAMLET"}]},
+                "scenes": [later],
+            })),
+            _reply("long:0", json.dumps({
+                "metadata": {"title": "Hamlet", "characters": [{"name": "Hamlet"}]},
+                "scenes": [SCENE],
+            })),
+        ])
+        self.parser.client.files.content.return_value = SimpleNamespace(text=output)
+
+        results = self.parser.collect_batch("batch-1")
+
+        self.assertEqual(list(results), ["long"])
+        self.assertEqual(results["long"]["metadata"]["title"], "Hamlet")
+        self.assertEqual(
+            [c["name"] for c in results["long"]["metadata"]["characters"]], ["Hamlet", "Claudius"]
+        )
+        self.assertEqual([s["title"] for s in results["long"]["scenes"]], ["Nunnery", "Mousetrap"])
+
+    def test_collect_raises_on_failed_batch(self):
+        self.parser.client.batches.retrieve.return_value = SimpleNamespace(status="expired")
+        with self.assertRaises(ValueError):
+            self.parser.collect_batch("batch-1")
+
+
+class CombinedRequestTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = ScriptParser.__new__(ScriptParser)
+
+    def _prompt(self, text):
+        return self.parser._combined_request(text)["messages"][0]["content"]
+
+    def test_inline_speaker_tags_are_split_before_the_prompt(self):
+        text = (
+            "HORATIO\nHail to your lordship.\n"
+            "HAMLET\nI am glad to see you well.\n"
+            "HORATIO\nWhere, my lord? HAMLET In my mind's eye, Horatio.\n"
+            "HORATIO\nI saw him once.\n"
+            "HAMLET\nHe was a man.\n"
+        )
+        prompt = self._prompt(text)
+        self.assertIn("Where, my lord?\nHAMLET\nIn my mind's eye", prompt)
+        self.assertNotIn("my lord? HAMLET In", prompt)
+
+    def test_prompt_carries_the_speaker_attribution_rules(self):
+        prompt = self._prompt(SCRIPT)
+        self.assertIn("EXACTLY ONE character", prompt)
+        self.assertIn("If a third character speaks", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Guard against script_parser.py growing a second ScriptParser class.
+
+A later definition would silently shadow the first, so edits to the
+"wrong" copy would do nothing.
+"""
+
+import ast
+import inspect
+import unittest
+
+from app.services import script_parser
+
+
+class ScriptParserModuleTests(unittest.TestCase):
+    def test_script_parser_is_defined_once(self):
+        tree = ast.parse(inspect.getsource(script_parser))
+        definitions = [
+            node for node in tree.body
+            if isinstance(node, ast.ClassDef) and node.name == "ScriptParser"
+        ]
+        self.assertEqual(len(definitions), 1)
+        _, first_line = inspect.getsourcelines(script_parser.ScriptParser)
+        self.assertEqual(definitions[0].lineno, first_line)
+
+
+if __name__ == "__main__":
+    unittest.main()
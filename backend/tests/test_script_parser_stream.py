@@ -0,0 +1,66 @@
+"""Streamed scene extraction.
+
+extract_chunk_ai streams the {"scenes": [...]} reply and hands each scene
+over as soon as its object closes; braces and quotes inside dialogue must
+not confuse the splitter, and a reply cut off mid-scene keeps the scenes
+that did complete.
+"""
+
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.services.script_parser import ScriptParser, _iter_streamed_scenes
+
+
+def _scene(title, text):
+    return {
+        "title": title,
+        "character_1": "HAMLET",
+        "character_2": "OPHELIA",
+        "lines": [{"character": "HAMLET", "text": text, "stage_direction": None}],
+    }
+
+
+SCENES = [
+    _scene("Nunnery", 'Get thee to a nunnery. {Why} "wouldst" thou [be] a breeder\\?'),
+    _scene("Mousetrap", "Lady, shall I lie in your lap?"),
+]
+REPLY = json.dumps({"scenes": SCENES})
+
+
+def _pieces(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _chunk(content, finish_reason=None):
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+class StreamedScenesTests(unittest.TestCase):
+    def test_scenes_survive_any_delta_boundaries(self):
+        for size in (1, 3, 7, len(REPLY)):
+            self.assertEqual(list(_iter_streamed_scenes(_pieces(REPLY, size))), SCENES)
+
+    def test_truncated_reply_keeps_complete_scenes(self):
+        cut = REPLY[:REPLY.index("Mousetrap")]
+        self.assertEqual(list(_iter_streamed_scenes([cut])), SCENES[:1])
+
+    def test_extract_chunk_ai_reports_each_scene(self):
+        parser = ScriptParser.__new__(ScriptParser)
+        parser.client = mock.MagicMock()
+        chunks = [_chunk(piece) for piece in _pieces(REPLY, 5)] + [_chunk(None, "stop")]
+        parser.client.chat.completions.create.return_value = iter(chunks)
+        seen = []
+
+        scenes = parser.extract_chunk_ai("HAMLET. Words.", [], on_scene=seen.append)
+
+        self.assertEqual([s["title"] for s in seen], ["Nunnery", "Mousetrap"])
+        self.assertEqual([s["title"] for s in scenes], ["Nunnery", "Mousetrap"])
+        self.assertTrue(parser.client.chat.completions.create.call_args.kwargs["stream"])
+
+
+if __name__ == "__main__":
+    unittest.main()
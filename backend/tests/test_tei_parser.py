@@ -0,0 +1,82 @@
+"""Tests for the merged lxml TEIParser.
+
+A TEI string is streamed with iterparse while a root from parse() is walked
+in place; both must yield the same monologues, and TEIXMLParser remains an
+alias for older imports.
+"""
+
+import unittest
+
+from app.services.extraction.tei_parser import TEIParser
+from app.services.extraction.tei_xml_parser import TEIXMLParser
+
+LINE = " ".join(["word"] * 30)
+
+
+def _tei(body, ns=' xmlns="http://www.tei-c.org/ns/1.0"'):
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><TEI{ns}>'
+        "<teiHeader><fileDesc><titleStmt><title>Hamlet</title>"
+        "<author>Shakespeare</author></titleStmt></fileDesc></teiHeader>"
+        f"<text><body>{body}</body></text></TEI>"
+    )
+
+
+class TEIParserTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = TEIParser()
+
+    def test_stage_direction_is_split_from_line(self):
+        xml = _tei(
+            f"<sp><speaker>HAMLET</speaker>"
+            f"<l>{LINE} <stage>Aside</stage> to be</l><l>{LINE}</l></sp>"
+        )
+        [monologue] = self.parser.extract_monologues(xml)
+        self.assertEqual(monologue["character"], "Hamlet")
+        self.assertEqual(monologue["stage_directions"], "Aside")
+        self.assertNotIn("Aside", monologue["text"])
+        self.assertEqual(monologue["word_count"], 62)
+
+    def test_streamed_string_matches_parsed_root(self):
+        for ns in (' xmlns="http://www.tei-c.org/ns/1.0"', ""):
+            xml = _tei(
+                f"<sp><speaker>HAMLET</speaker><l>{LINE}</l><l>{LINE}</l></sp>"
+                f'<sp who="#lady_macbeth"><p>{LINE} {LINE}</p></sp>',
+                ns=ns,
+            )
+            streamed = self.parser.extract_monologues(xml)
+            walked = self.parser.extract_monologues(self.parser.parse(xml))
+            self.assertEqual(streamed, walked)
+            self.assertEqual([m["character"] for m in streamed], ["Hamlet", "Lady Macbeth"])
+
+    def test_ab_only_speech_is_extracted(self):
+        xml = _tei(
+            f"<sp><speaker>HAMLET</speaker><ab>{LINE}</ab><ab>{LINE}</ab></sp>"
+            f"<sp><speaker>HORATIO</speaker><p>{LINE} {LINE}</p></sp>"
+        )
+        monologues = self.parser.extract_monologues(xml)
+        self.assertEqual([m["character"] for m in monologues], ["Hamlet", "Horatio"])
+        self.assertEqual(monologues[0]["word_count"], 60)
+
+    def test_verse_lines_keep_their_line_breaks(self):
+        xml = _tei(f"<sp><speaker>HAMLET</speaker><l>  {LINE}\n  </l><l>{LINE}</l></sp>")
+        [monologue] = self.parser.extract_monologues(xml)
+        self.assertEqual(monologue["text"], f"{LINE}\n{LINE}")
+
+    def test_unparseable_input_yields_nothing(self):
+        self.assertEqual(self.parser.extract_monologues("<TEI><sp>"), [])
+        self.assertFalse(self.parser.is_valid_tei_xml("not xml <"))
+
+    def test_metadata_and_validation(self):
+        xml = _tei("")
+        self.assertTrue(self.parser.is_valid_tei_xml(xml))
+        metadata = self.parser.extract_play_metadata(xml)
+        self.assertEqual(metadata["title"], "Hamlet")
+        self.assertEqual(metadata["author"], "Shakespeare")
+
+    def test_teixmlparser_is_an_alias(self):
+        self.assertIs(TEIXMLParser, TEIParser)
+
+
+if __name__ == "__main__":
+    unittest.main()
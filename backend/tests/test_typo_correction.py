@@ -0,0 +1,69 @@
+"""Query typo correction.
+
+Corrections are memoized per query and fuzzy matches per word, and
+rapidfuzz prefilters the candidates. None of this may change which word
+difflib picks.
+"""
+
+import unittest
+from difflib import get_close_matches
+from unittest import mock
+
+from app.services.search import query_optimizer
+from app.services.search.query_optimizer import (
+    _correct_query_typos_cached,
+    _fuzzy_correct,
+    _vocab_candidates,
+    correct_query_typos,
+)
+
+
+class CorrectQueryTyposTests(unittest.TestCase):
+    def test_known_and_fuzzy_typos_are_corrected(self):
+        self.assertEqual(
+            correct_query_typos("shakespear monologe"),
+            ("shakespeare monologue", True, True, False),
+        )
+
+    def test_unfixable_word_hides_the_banner(self):
+        self.assertEqual(
+            correct_query_typos("shakespear mnonologeawewewe"),
+            ("shakespeare mnonologeawewewe", True, False, True),
+        )
+
+    def test_correct_query_is_unchanged(self):
+        self.assertEqual(correct_query_typos("sad woman"), ("sad woman", False, False, False))
+
+    def test_blank_query_returns_the_same_four_fields(self):
+        self.assertEqual(correct_query_typos(" "), (" ", False, False, False))
+
+    def test_spacing_variants_share_a_cache_entry(self):
+        first = correct_query_typos("hamlt monologe")
+        hits = _correct_query_typos_cached.cache_info().hits
+        self.assertEqual(correct_query_typos("  hamlt   monologe "), first)
+        self.assertEqual(_correct_query_typos_cached.cache_info().hits, hits + 1)
+
+
+class FuzzyCorrectTests(unittest.TestCase):
+    WORDS = ("hamlt", "monolouge", "shakspeare", "tragidy", "vilain", "qqqqzz", "comedyy")
+
+    def test_rapidfuzz_prefilter_matches_difflib(self):
+        with_prefilter = [_fuzzy_correct.__wrapped__(w) for w in self.WORDS]
+        difflib_only = [
+            (get_close_matches(w, _vocab_candidates(len(w)), n=1, cutoff=0.8) or [None])[0]
+            for w in self.WORDS
+        ]
+        self.assertEqual(with_prefilter, difflib_only)
+        self.assertIsNone(with_prefilter[self.WORDS.index("qqqqzz")])
+
+    def test_candidates_are_scored_by_rapidfuzz(self):
+        with mock.patch.object(
+            query_optimizer.process, "extract", wraps=query_optimizer.process.extract
+        ) as extract:
+            self.assertEqual(_fuzzy_correct.__wrapped__("tragidy"), "tragedy")
+        extract.assert_called_once()
+        self.assertIs(extract.call_args.kwargs["scorer"], query_optimizer.fuzz.ratio)
+
+
+if __name__ == "__main__":
+    unittest.main()